@@ -1,95 +1,33 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import io
+import os
 import hashlib
+import hmac
+import html
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
-# Import modular helpers
-from helpers.datetime_utils import detect_datetime_format
-from helpers.ml_analysis import analyze_data_with_ml, get_data_statistics
-from helpers.visualizations import create_visualization
-from helpers.comparison import (
-    calculate_comparison_summary, 
-    calculate_overall_change,
-    calculate_average_difference,
-    create_comparison_chart,
-    calculate_metric_change
-)
-from helpers.ceo_dashboard import (
-    create_kpi_cards,
-    create_revenue_trend,
-    create_regional_performance,
-    create_product_mix,
-    create_efficiency_metrics,
-    create_promotion_impact,
-    create_top_products
-)
-from helpers.custom_charts import (
-    get_column_types,
-    create_custom_line_chart,
-    create_custom_bar_chart,
-    create_custom_scatter,
-    create_custom_pie_chart,
-    create_custom_box_plot,
-    create_custom_heatmap,
-    create_custom_area_chart,
-    create_custom_histogram
+# Plotting helpers are imported inside the pages that use them so the
+# login page renders without paying for Plotly's import
+from helpers.data_io import (
+    read_uploaded_file, read_sample_csv, to_csv_bytes, to_excel_bytes, to_parquet_bytes, dataframe_fingerprint
 )
 
+# Logo used for the page icon and in the sidebar, login and home pages
+LOGO_PATH = "logo/flowviz_logo.png"
+
 # Page configuration
 st.set_page_config(
     page_title="FlowViz - Industry Data Analytics",
-    page_icon="logo/flowviz_logo.png",
+    page_icon=LOGO_PATH,
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for professional look
-st.markdown("""
-    <style>
-    .main {
-        background-color: #f8f9fa;
-    }
-    .stButton>button {
-        width: 100%;
-        background-color: #0066cc;
-        color: white;
-        border-radius: 5px;
-        padding: 10px;
-        font-weight: bold;
-    }
-    .stButton>button:hover {
-        background-color: #0052a3;
-    }
-    .feature-card {
-        background-color: white;
-        padding: 20px;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin: 10px 0;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 10px;
-        text-align: center;
-    }
-    h1, h2, h3 {
-        color: #2c3e50;
-    }
-    .carousel-item {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 40px;
-        border-radius: 15px;
-        text-align: center;
-        margin: 10px;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS for professional look, served from static/flowviz.css so the
+# browser caches it instead of receiving the stylesheet on every rerun. The
+# tag is emitted on each run because elements a rerun skips are removed.
+st.markdown('<link rel="stylesheet" href="app/static/flowviz.css">', unsafe_allow_html=True)
 
 # Initialize session state
 if 'logged_in' not in st.session_state:
@@ -98,21 +36,326 @@ if 'username' not in st.session_state:
     st.session_state.username = ''
 if 'data' not in st.session_state:
     st.session_state.data = None
+if 'data_hash' not in st.session_state:
+    st.session_state.data_hash = None
+if 'file_hash' not in st.session_state:
+    st.session_state.file_hash = None
+if 'kpis' not in st.session_state:
+    st.session_state.kpis = None
 if 'previous_data' not in st.session_state:
     st.session_state.previous_data = None
-if 'page' not in st.session_state:
-    st.session_state.page = 'login'
+if 'comparison_upload' not in st.session_state:
+    st.session_state.comparison_upload = None
+
+# Sidebar footer, one markdown element instead of three
+_SIDEBAR_ABOUT = "### ℹ️ About\n\nFlowViz v1.0\n\nIndustry Data Analytics Platform"
+
+# Bundled sample datasets
+SAMPLE_FILES = {
+    "August 2025": "SampleData/Aug.csv",
+    "September 2025": "SampleData/Sep.csv",
+    "October 2025": "SampleData/Oct.csv"
+}
+
+# Seconds a cached upload, or anything derived from it, stays in server memory
+DATASET_CACHE_TTL = 3600
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=DATASET_CACHE_TTL)
+def _load_uploaded_file(file_key: str, file_name: str, _data: bytes) -> pd.DataFrame:
+    return read_uploaded_file(_data, file_name)
+
+def file_digest(data: bytes) -> str:
+    """Short content hash identifying an uploaded file"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def load_uploaded_file(uploaded_file) -> pd.DataFrame:
+    """Parse an uploaded file, cached on its contents across reruns"""
+    # Read the bytes once; the digest keys the cache so Streamlit does not rehash them
+    data = uploaded_file.getvalue()
+    return _load_uploaded_file(file_digest(data), uploaded_file.name, data)
+
+def load_uploaded_files(*uploaded_files) -> list[pd.DataFrame]:
+    """Parse several uploaded files concurrently; the CSV and Excel parsers release the GIL"""
+    with ThreadPoolExecutor(max_workers=len(uploaded_files)) as executor:
+        return list(executor.map(load_uploaded_file, uploaded_files))
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_sample_files(mtimes: tuple) -> dict:
+    # The Arrow parser releases the GIL, so the files are parsed concurrently
+    paths = list(SAMPLE_FILES.values())
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return dict(zip(paths, executor.map(read_sample_csv, paths)))
+
+def prefetch_sample_files() -> dict:
+    """Parse every sample dataset once per process, again only if a file changes on disk"""
+    return _load_sample_files(tuple(os.path.getmtime(path) for path in SAMPLE_FILES.values()))
+
+def load_sample_file(path: str) -> pd.DataFrame:
+    """Read a sample dataset from the shared prefetch"""
+    # The prefetched frames are shared across sessions, so hand out a copy
+    return prefetch_sample_files()[path].copy()
+
+@st.cache_resource(show_spinner=False)
+def load_logo() -> bytes:
+    """Logo image bytes, read from disk once per process"""
+    with open(LOGO_PATH, 'rb') as f:
+        return f.read()
+
+def set_active_data(df, file_hash: str = None):
+    """Share a dataset with all pages, fingerprinted once for the caches below"""
+    from helpers.ceo_dashboard import create_kpi_cards
+    data_hash = dataframe_fingerprint(df)
+    # The dataset being replaced stays available to the comparison page
+    if st.session_state.data is not None and st.session_state.data_hash != data_hash:
+        st.session_state.previous_data = st.session_state.data
+    st.session_state.data = df
+    # Digest of the uploaded file the data came from (None for sample data)
+    st.session_state.file_hash = file_hash
+    st.session_state.data_hash = data_hash
+    # KPIs only change with the data, so the dashboard reads them from here
+    st.session_state.kpis = create_kpi_cards(df)
+
+def requires_data(title: str):
+    """Decorate a page that needs a loaded dataset: show its title, then a
+    warning instead of the page body while no data is loaded"""
+    def decorator(page):
+        @functools.wraps(page)
+        def wrapper():
+            st.title(title)
+            if st.session_state.data is None:
+                st.warning("⚠️ Please load data first from the Data Visualization page")
+                return
+            return page()
+        return wrapper
+    return decorator
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=DATASET_CACHE_TTL)
+def get_cached_statistics(df_hash: str, _df: pd.DataFrame) -> dict:
+    """Basic statistics for the active dataset, cached on its fingerprint"""
+    from helpers.ml_analysis import get_data_statistics
+    return get_data_statistics(_df)
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=DATASET_CACHE_TTL)
+def get_cached_recommendations(df_hash: str, _df: pd.DataFrame) -> list[dict]:
+    """Visualization recommendations for the active dataset, cached on its fingerprint"""
+    from helpers.ml_analysis import analyze_data_with_ml
+    return analyze_data_with_ml(_df)
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=DATASET_CACHE_TTL)
+def get_cached_column_types(df_hash: str, _df: pd.DataFrame) -> dict:
+    """Numeric/categorical/date column split for the active dataset, cached on its fingerprint"""
+    from helpers.custom_charts import get_column_types
+    return get_column_types(_df)
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=DATASET_CACHE_TTL)
+def get_cached_correlation(df_hash: str, _df: pd.DataFrame, columns: tuple) -> pd.DataFrame:
+    """Correlation matrix of the given numeric columns, cached on the dataset fingerprint"""
+    from helpers.ml_analysis import fast_corr
+    return fast_corr(_df, list(columns))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_cached_custom_chart(df_hash: str, _df: pd.DataFrame, builder: str, args: tuple):
+    """Custom chart built by helpers.custom_charts.<builder>(df, *args), cached on the dataset and inputs"""
+    from helpers import custom_charts
+    return getattr(custom_charts, builder)(_df, *args)
 
-# User credentials (in production, use a database)
+@st.cache_data(show_spinner=False, max_entries=16, ttl=DATASET_CACHE_TTL)
+def get_cached_visualization(df_hash: str, _df: pd.DataFrame, recommendation: dict):
+    """
+    Recommended chart and its HTML download, cached on the dataset fingerprint and recommendation.
+    
+    Up to five charts per dataset, so 16 entries hold the charts of the
+    current and previous datasets.
+    """
+    from helpers.visualizations import create_visualization
+    from helpers.figure_utils import figure_to_html_bytes
+    fig = create_visualization(_df, recommendation)
+    if fig is None:
+        return None, None
+    return fig, figure_to_html_bytes(fig)
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=DATASET_CACHE_TTL)
+def get_cached_export(df_hash: str, _df: pd.DataFrame, file_format: str) -> bytes:
+    """Active dataset serialized as 'csv', 'xlsx' or 'parquet', cached on its fingerprint"""
+    if file_format == 'xlsx':
+        return to_excel_bytes(_df, sheet_name='Data')
+    if file_format == 'parquet':
+        return to_parquet_bytes(_df)
+    return to_csv_bytes(_df)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_cached_comparison_overview(totals: tuple):
+    """
+    Month-over-month subplot figure and its HTML download.
+    
+    Keyed on (column, previous total, current total) triples, which fully
+    determine the chart, so reruns reuse the figure and the HTML bytes.
+    """
+    from helpers.comparison import create_comparison_overview
+    from helpers.figure_utils import figure_to_html_bytes
+    columns = [column for column, _, _ in totals]
+    fig = create_comparison_overview(
+        columns,
+        pd.Series({column: previous for column, previous, _ in totals}),
+        pd.Series({column: current for column, _, current in totals})
+    )
+    return fig, figure_to_html_bytes(fig)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_cached_summary_exports(summary: pd.DataFrame) -> tuple[bytes, bytes]:
+    """CSV and Excel bytes of a comparison summary; the summary has one row per metric, so hashing it is cheap"""
+    return to_csv_bytes(summary), to_excel_bytes(summary, sheet_name='Comparison')
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=DATASET_CACHE_TTL)
+def get_cached_preview(df_hash: str, _df: pd.DataFrame, rows: int = 10):
+    """First rows of the active dataset as an Arrow table, cached on its fingerprint"""
+    import pyarrow as pa
+    head = _df.head(rows)
+    try:
+        return pa.Table.from_pandas(head, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns (common in Excel uploads) have no Arrow type;
+        # st.dataframe converts the DataFrame with its own fallbacks
+        return head
+
+def render_chart(fig):
+    """Move large traces to WebGL and downsample them, then display the figure"""
+    from helpers.figure_utils import downsample_figure, to_webgl
+    fig = downsample_figure(to_webgl(fig))
+    # theme=None keeps each figure's own template and skips Streamlit's theming pass
+    st.plotly_chart(fig, use_container_width=True, theme=None, config={'scrollZoom': True})
+
+_METRIC_CARD = "<div class='metric-card'><h3>{value}</h3><p>{label}</p></div>"
+
+def render_metric_row(cards):
+    """Render (value, label) pairs as one row of metric cards in a single markdown call"""
+    row = ''.join(_METRIC_CARD.format(value=value, label=label) for value, label in cards)
+    st.markdown(f"<div class='metric-row'>{row}</div>", unsafe_allow_html=True)
+
+# User credentials as precomputed raw SHA-256 digests (in production, use a
+# database and a salted KDF such as hashlib.scrypt)
 USERS = {
-    'admin': hashlib.sha256('admin123'.encode()).hexdigest(),
-    'demo': hashlib.sha256('demo123'.encode()).hexdigest(),
+    'admin': bytes.fromhex('240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9'),
+    'demo': bytes.fromhex('d3ad9315b7be5dd53b31a273b3b3aba5defe700808305aa16a3062b76658a791'),
 }
 
 def verify_login(username, password):
     """Verify user credentials"""
-    hashed_password = hashlib.sha256(password.encode()).hexdigest()
-    return username in USERS and USERS[username] == hashed_password
+    stored = USERS.get(username)
+    # Hash before the lookup result is checked so unknown users take the same time
+    digest = hashlib.sha256(password.encode()).digest()
+    return stored is not None and hmac.compare_digest(stored, digest)
+
+# Static home page markup, built once at import; only the greeting is formatted per run
+_HERO_TEMPLATE = """
+<div class="hero-section">
+    <h1 class="hero-title">
+        Turn <span class="flow-gradient">Industrial Data Flow</span><br>
+        into <span style="color: #10b981;">Actionable Intelligence</span>
+    </h1>
+    <p class="hero-subtitle">
+        FlowViz is your central hub for manufacturing, supply chain, and resource utilization analysis—built for real-time operational excellence.
+    </p>
+    <p style="font-size: 1.2rem; color: #374151; margin-top: 20px;">
+        👋 Welcome back, <strong>{username}</strong>!
+    </p>
+</div>
+"""
+
+_FEATURE_CARDS = [
+    """
+    <div class="data-card">
+        <span class="feature-icon">📊</span>
+        <h3 style="color: #10b981; margin-bottom: 15px;">Overall Equipment Efficiency (OEE)</h3>
+        <p style="color: #6b7280; font-size: 0.95rem;">
+            Automated calculation of Availability, Performance, and Quality using production logs and shift data.
+        </p>
+    </div>
+    """,
+    """
+    <div class="data-card">
+        <span class="feature-icon">⚡</span>
+        <h3 style="color: #06b6d4; margin-bottom: 15px;">Utility & Resource Consumption</h3>
+        <p style="color: #6b7280; font-size: 0.95rem;">
+            Visualize kWh, water, and manpower per unit of output to identify waste and drive sustainability.
+        </p>
+    </div>
+    """,
+    """
+    <div class="data-card">
+        <span class="feature-icon">⚠️</span>
+        <h3 style="color: #eab308; margin-bottom: 15px;">Real-Time Anomaly Alerts</h3>
+        <p style="color: #6b7280; font-size: 0.95rem;">
+            Receive instant notifications for unexpected deviations in production metrics or utility spikes.
+        </p>
+    </div>
+    """,
+    """
+    <div class="data-card">
+        <span class="feature-icon">🔮</span>
+        <h3 style="color: #8b5cf6; margin-bottom: 15px;">Predictive Maintenance</h3>
+        <p style="color: #6b7280; font-size: 0.95rem;">
+            Leverage historical data to predict machine failures and optimize maintenance schedules.
+        </p>
+    </div>
+    """
+]
+
+_USE_CASES_HTML = """
+<div class="use-case-section">
+    <h2 style="font-size: 2.5rem; margin-bottom: 30px; text-align: center;">
+        🏭 Empowering Decisions Across the Factory Floor
+    </h2>
+    <p style="font-size: 1.2rem; margin-bottom: 40px; text-align: center; opacity: 0.95;">
+        FlowViz integrates seamlessly with ERP, MES, and sensor data to provide a unified view of your entire operation, from raw materials to final shipment.
+    </p>
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-top: 30px;">
+        <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
+            <h3 style="margin-bottom: 10px;">✅ Manufacturing</h3>
+            <p style="opacity: 0.9;">Reduce bottlenecks and increase throughput efficiency.</p>
+        </div>
+        <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
+            <h3 style="margin-bottom: 10px;">✅ Utility Management</h3>
+            <p style="opacity: 0.9;">Pinpoint processes with the highest energy and water footprint.</p>
+        </div>
+        <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
+            <h3 style="margin-bottom: 10px;">✅ Quality Control</h3>
+            <p style="opacity: 0.9;">Correlate production inputs with finished product quality metrics.</p>
+        </div>
+    </div>
+</div>
+"""
+
+_QUICK_START_STEPS = [
+    """
+    <div style="text-align: center; padding: 20px;">
+        <div style="font-size: 3rem; margin-bottom: 15px;">1️⃣</div>
+        <h3 style="color: #10b981; margin-bottom: 10px;">Upload Data</h3>
+        <p style="color: #6b7280;">Navigate to Data Visualization and upload your CSV or Excel files</p>
+    </div>
+    """,
+    """
+    <div style="text-align: center; padding: 20px;">
+        <div style="font-size: 3rem; margin-bottom: 15px;">2️⃣</div>
+        <h3 style="color: #06b6d4; margin-bottom: 10px;">Analyze</h3>
+        <p style="color: #6b7280;">Let AI recommend the best visualizations for your data</p>
+    </div>
+    """,
+    """
+    <div style="text-align: center; padding: 20px;">
+        <div style="font-size: 3rem; margin-bottom: 15px;">3️⃣</div>
+        <h3 style="color: #8b5cf6; margin-bottom: 10px;">Export</h3>
+        <p style="color: #6b7280;">Download insights and share with your team</p>
+    </div>
+    """
+]
+
+# Each card row is sent as one grid block rather than one markdown element per column
+_FEATURE_GRID_HTML = f"<div class='card-grid'>{''.join(card.strip() for card in _FEATURE_CARDS)}</div>"
+_QUICK_START_HTML = f"<div class='card-grid'>{''.join(step.strip() for step in _QUICK_START_STEPS)}</div>"
+
+# Login heading; its styling lives in static/flowviz.css with the rest of the app's CSS
+_LOGIN_HEADER_HTML = "<h1 class='centered'>FlowViz</h1><h3 class='centered'>Industry Data Analytics Platform</h3><br>"
 
 def login_page():
     """Display login page"""
@@ -122,11 +365,9 @@ def login_page():
         # Display logo
         col_logo1, col_logo2, col_logo3 = st.columns([1, 1, 1])
         with col_logo2:
-            st.image("logo/flowviz_logo.png", width=150)
+            st.image(load_logo(), width=150)
         
-        st.markdown("<h1 style='text-align: center;'>FlowViz</h1>", unsafe_allow_html=True)
-        st.markdown("<h3 style='text-align: center;'>Industry Data Analytics Platform</h3>", unsafe_allow_html=True)
-        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown(_LOGIN_HEADER_HTML, unsafe_allow_html=True)
         
         with st.container():
             st.markdown("<div class='feature-card'>", unsafe_allow_html=True)
@@ -140,7 +381,6 @@ def login_page():
                     if verify_login(username, password):
                         st.session_state.logged_in = True
                         st.session_state.username = username
-                        st.session_state.page = 'home'
                         st.rerun()
                     else:
                         st.error("Invalid username or password")
@@ -156,207 +396,23 @@ def home_page():
     # Display logo at the top
     col_logo1, col_logo2, col_logo3 = st.columns([2, 1, 2])
     with col_logo2:
-        st.image("logo/flowviz_logo.png", width=200)
-    
-    # Modern dark-themed CSS with Tailwind-inspired styling
-    st.markdown("""
-    <style>
-        .flow-gradient {
-            background: linear-gradient(90deg, #10b981 0%, #06b6d4 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            font-weight: 800;
-        }
-        .hero-section {
-            background-image: radial-gradient(circle at 50% 10%, rgba(20, 184, 166, 0.15) 0%, rgba(248, 249, 250, 1) 70%);
-            padding: 80px 20px;
-            border-radius: 20px;
-            text-align: center;
-            margin: 20px 0;
-        }
-        .data-card {
-            background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-            padding: 30px;
-            border-radius: 15px;
-            border: 2px solid #e5e7eb;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-            height: 100%;
-        }
-        .data-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 15px -3px rgba(6, 182, 212, 0.3);
-            border-color: #06b6d4;
-        }
-        .feature-icon {
-            font-size: 2.5rem;
-            margin-bottom: 15px;
-            display: block;
-        }
-        .use-case-section {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 60px 40px;
-            border-radius: 20px;
-            margin: 40px 0;
-        }
-        .hero-title {
-            font-size: 3.5rem;
-            font-weight: 800;
-            line-height: 1.2;
-            margin-bottom: 20px;
-            color: #1f2937;
-        }
-        .hero-subtitle {
-            font-size: 1.5rem;
-            color: #6b7280;
-            margin-bottom: 30px;
-            max-width: 800px;
-            margin-left: auto;
-            margin-right: auto;
-        }
-        .cta-button {
-            background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-            color: white;
-            padding: 15px 40px;
-            border-radius: 10px;
-            font-weight: 600;
-            font-size: 1.1rem;
-            border: none;
-            cursor: pointer;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-        }
-        .cta-button:hover {
-            transform: scale(1.05);
-            box-shadow: 0 10px 15px -3px rgba(6, 182, 212, 0.4);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+        st.image(load_logo(), width=200)
     
     # Hero Section
-    st.markdown(f"""
-    <div class="hero-section">
-        <h1 class="hero-title">
-            Turn <span class="flow-gradient">Industrial Data Flow</span><br>
-            into <span style="color: #10b981;">Actionable Intelligence</span>
-        </h1>
-        <p class="hero-subtitle">
-            FlowViz is your central hub for manufacturing, supply chain, and resource utilization analysis—built for real-time operational excellence.
-        </p>
-        <p style="font-size: 1.2rem; color: #374151; margin-top: 20px;">
-            👋 Welcome back, <strong>{st.session_state.username}</strong>!
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HERO_TEMPLATE.format(username=html.escape(st.session_state.username)), unsafe_allow_html=True)
     
     # Key Analytical Features Section
-    st.markdown("<h2 style='text-align: center; font-size: 2.5rem; margin: 60px 0 40px 0; color: #1f2937;'>⚡ Key Analytical Features</h2>", unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="data-card">
-            <span class="feature-icon">📊</span>
-            <h3 style="color: #10b981; margin-bottom: 15px;">Overall Equipment Efficiency (OEE)</h3>
-            <p style="color: #6b7280; font-size: 0.95rem;">
-                Automated calculation of Availability, Performance, and Quality using production logs and shift data.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("<h2 class='section-heading'>⚡ Key Analytical Features</h2>", unsafe_allow_html=True)
     
-    with col2:
-        st.markdown("""
-        <div class="data-card">
-            <span class="feature-icon">⚡</span>
-            <h3 style="color: #06b6d4; margin-bottom: 15px;">Utility & Resource Consumption</h3>
-            <p style="color: #6b7280; font-size: 0.95rem;">
-                Visualize kWh, water, and manpower per unit of output to identify waste and drive sustainability.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="data-card">
-            <span class="feature-icon">⚠️</span>
-            <h3 style="color: #eab308; margin-bottom: 15px;">Real-Time Anomaly Alerts</h3>
-            <p style="color: #6b7280; font-size: 0.95rem;">
-                Receive instant notifications for unexpected deviations in production metrics or utility spikes.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="data-card">
-            <span class="feature-icon">🔮</span>
-            <h3 style="color: #8b5cf6; margin-bottom: 15px;">Predictive Maintenance</h3>
-            <p style="color: #6b7280; font-size: 0.95rem;">
-                Leverage historical data to predict machine failures and optimize maintenance schedules.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_FEATURE_GRID_HTML, unsafe_allow_html=True)
     
     # Use Cases Section
-    st.markdown("""
-    <div class="use-case-section">
-        <h2 style="font-size: 2.5rem; margin-bottom: 30px; text-align: center;">
-            🏭 Empowering Decisions Across the Factory Floor
-        </h2>
-        <p style="font-size: 1.2rem; margin-bottom: 40px; text-align: center; opacity: 0.95;">
-            FlowViz integrates seamlessly with ERP, MES, and sensor data to provide a unified view of your entire operation, from raw materials to final shipment.
-        </p>
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-top: 30px;">
-            <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
-                <h3 style="margin-bottom: 10px;">✅ Manufacturing</h3>
-                <p style="opacity: 0.9;">Reduce bottlenecks and increase throughput efficiency.</p>
-            </div>
-            <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
-                <h3 style="margin-bottom: 10px;">✅ Utility Management</h3>
-                <p style="opacity: 0.9;">Pinpoint processes with the highest energy and water footprint.</p>
-            </div>
-            <div style="padding: 20px; background: rgba(255, 255, 255, 0.1); border-radius: 10px;">
-                <h3 style="margin-bottom: 10px;">✅ Quality Control</h3>
-                <p style="opacity: 0.9;">Correlate production inputs with finished product quality metrics.</p>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_USE_CASES_HTML, unsafe_allow_html=True)
     
     # Quick Start Guide
-    st.markdown("<h2 style='text-align: center; font-size: 2rem; margin: 60px 0 30px 0; color: #1f2937;'>🚀 Quick Start</h2>", unsafe_allow_html=True)
+    st.markdown("<h2 class='section-heading compact'>🚀 Quick Start</h2>", unsafe_allow_html=True)
     
-    col_a, col_b, col_c = st.columns(3)
-    
-    with col_a:
-        st.markdown("""
-        <div style="text-align: center; padding: 20px;">
-            <div style="font-size: 3rem; margin-bottom: 15px;">1️⃣</div>
-            <h3 style="color: #10b981; margin-bottom: 10px;">Upload Data</h3>
-            <p style="color: #6b7280;">Navigate to Data Visualization and upload your CSV or Excel files</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_b:
-        st.markdown("""
-        <div style="text-align: center; padding: 20px;">
-            <div style="font-size: 3rem; margin-bottom: 15px;">2️⃣</div>
-            <h3 style="color: #06b6d4; margin-bottom: 10px;">Analyze</h3>
-            <p style="color: #6b7280;">Let AI recommend the best visualizations for your data</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_c:
-        st.markdown("""
-        <div style="text-align: center; padding: 20px;">
-            <div style="font-size: 3rem; margin-bottom: 15px;">3️⃣</div>
-            <h3 style="color: #8b5cf6; margin-bottom: 10px;">Export</h3>
-            <p style="color: #6b7280;">Download insights and share with your team</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_QUICK_START_HTML, unsafe_allow_html=True)
     
     st.markdown("<br><br>", unsafe_allow_html=True)
     st.info("👈 Use the sidebar to navigate to Data Visualization or Month Comparison")
@@ -379,21 +435,18 @@ def data_visualization_page():
     uploaded_file = None
     
     if data_source == "📂 Use Sample Data":
-        sample_files = {
-            "August 2025": "SampleData/Aug.csv",
-            "September 2025": "SampleData/Sep.csv",
-            "October 2025": "SampleData/Oct.csv"
-        }
-        
-        selected_sample = st.selectbox(
-            "Choose Sample Dataset:",
-            list(sample_files.keys())
-        )
+        # Picking a dataset only reruns the page once the form is submitted
+        with st.form("sample_data_form", border=False):
+            selected_sample = st.selectbox(
+                "Choose Sample Dataset:",
+                list(SAMPLE_FILES.keys())
+            )
+            load_clicked = st.form_submit_button("Load Sample Data", type="primary")
         
-        if st.button("Load Sample Data", type="primary"):
+        if load_clicked:
             try:
-                df = pd.read_csv(sample_files[selected_sample])
-                st.session_state.data = df
+                df = load_sample_file(SAMPLE_FILES[selected_sample])
+                set_active_data(df)
                 st.success(f"✅ Sample data '{selected_sample}' loaded successfully!")
                 uploaded_file = "sample"  # Flag to trigger processing
             except Exception as e:
@@ -410,13 +463,13 @@ def data_visualization_page():
         try:
             # Only read file if it's not the sample flag
             if uploaded_file != "sample":
-                # Read the file
-                if uploaded_file.name.endswith('.csv'):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    df = pd.read_excel(uploaded_file)
-                
-                st.session_state.data = df
+                # Reruns with the same upload skip parsing, fingerprinting
+                # and KPI computation altogether
+                data = uploaded_file.getvalue()
+                digest = file_digest(data)
+                if digest != st.session_state.file_hash:
+                    set_active_data(_load_uploaded_file(digest, uploaded_file.name, data), digest)
+                df = st.session_state.data
                 st.success(f"✅ File loaded successfully! Shape: {df.shape[0]} rows × {df.shape[1]} columns")
             
             # Use data from session state (either just loaded or from sample)
@@ -428,43 +481,16 @@ def data_visualization_page():
             
             # Show data preview
             with st.expander("🔍 Data Preview", expanded=True):
-                st.dataframe(df.head(10), use_container_width=True)
+                st.dataframe(get_cached_preview(st.session_state.data_hash, df), use_container_width=True)
             
             # Basic statistics using helper
-            stats = get_data_statistics(df)
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                    <div class='metric-card'>
-                        <h3>{stats['total_rows']}</h3>
-                        <p>Total Rows</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                    <div class='metric-card'>
-                        <h3>{stats['total_columns']}</h3>
-                        <p>Total Columns</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                    <div class='metric-card'>
-                        <h3>{stats['numeric_columns']}</h3>
-                        <p>Numeric Columns</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                    <div class='metric-card'>
-                        <h3>{stats['categorical_columns']}</h3>
-                        <p>Categorical Columns</p>
-                    </div>
-                """, unsafe_allow_html=True)
+            stats = get_cached_statistics(st.session_state.data_hash, df)
+            render_metric_row([
+                (stats['total_rows'], "Total Rows"),
+                (stats['total_columns'], "Total Columns"),
+                (stats['numeric_columns'], "Numeric Columns"),
+                (stats['categorical_columns'], "Categorical Columns")
+            ])
             
             st.markdown("---")
             
@@ -472,26 +498,21 @@ def data_visualization_page():
             st.header("🤖 ML-Recommended Visualizations")
             st.info("Our machine learning algorithm has analyzed your data and recommends the following visualizations:")
             
-            recommendations = analyze_data_with_ml(df)
+            recommendations = get_cached_recommendations(st.session_state.data_hash, df)
             
             if recommendations:
                 for idx, rec in enumerate(recommendations):
                     with st.container():
                         st.subheader(f"📈 Visualization {idx + 1}: {rec['title']}")
                         
-                        fig = create_visualization(df, rec)
+                        fig, html_bytes = get_cached_visualization(st.session_state.data_hash, df, rec)
                         
                         if fig:
-                            st.plotly_chart(fig, use_container_width=True)
+                            render_chart(fig)
                             
-                            # Download button
+                            # Download button with the cached CDN-backed HTML page
                             col_a, col_b, col_c = st.columns([3, 1, 3])
                             with col_b:
-                                # Convert figure to HTML
-                                buffer = io.StringIO()
-                                fig.write_html(buffer)
-                                html_bytes = buffer.getvalue().encode()
-                                
                                 st.download_button(
                                     label="💾 Download Chart",
                                     data=html_bytes,
@@ -504,10 +525,10 @@ def data_visualization_page():
             
             # Download processed data
             st.header("💾 Download Data")
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             
             with col1:
-                csv = df.to_csv(index=False).encode('utf-8')
+                csv = get_cached_export(st.session_state.data_hash, df, 'csv')
                 st.download_button(
                     label="📥 Download as CSV",
                     data=csv,
@@ -517,11 +538,8 @@ def data_visualization_page():
                 )
             
             with col2:
-                # Create Excel file in memory
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Data')
-                excel_data = output.getvalue()
+                # Excel file built in memory once per dataset
+                excel_data = get_cached_export(st.session_state.data_hash, df, 'xlsx')
                 
                 st.download_button(
                     label="📥 Download as Excel",
@@ -530,6 +548,18 @@ def data_visualization_page():
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     use_container_width=True
                 )
+            
+            with col3:
+                # Compact, typed alternative to Excel for large datasets
+                parquet_data = get_cached_export(st.session_state.data_hash, df, 'parquet')
+                
+                st.download_button(
+                    label="📥 Download as Parquet",
+                    data=parquet_data,
+                    file_name="processed_data.parquet",
+                    mime="application/vnd.apache.parquet",
+                    use_container_width=True
+                )
         
         except Exception as e:
             st.error(f"Error loading file: {str(e)}")
@@ -540,11 +570,11 @@ def data_visualization_page():
         
         # Show the same analysis for persisted data
         with st.expander("🔍 Data Preview", expanded=False):
-            st.dataframe(df.head(10), use_container_width=True)
+            st.dataframe(get_cached_preview(st.session_state.data_hash, df), use_container_width=True)
         
         # Continue with analysis...
-        stats = get_data_statistics(df)
-        recommendations = analyze_data_with_ml(df)
+        stats = get_cached_statistics(st.session_state.data_hash, df)
+        recommendations = get_cached_recommendations(st.session_state.data_hash, df)
         
         # Display recommendations
         if recommendations:
@@ -552,14 +582,11 @@ def data_visualization_page():
             for idx, rec in enumerate(recommendations):
                 with st.container():
                     st.subheader(f"📈 Visualization {idx + 1}: {rec['title']}")
-                    fig = create_visualization(df, rec)
+                    fig, html_bytes = get_cached_visualization(st.session_state.data_hash, df, rec)
                     if fig:
-                        st.plotly_chart(fig, use_container_width=True)
+                        render_chart(fig)
                         col_a, col_b, col_c = st.columns([3, 1, 3])
                         with col_b:
-                            buffer = io.StringIO()
-                            fig.write_html(buffer)
-                            html_bytes = buffer.getvalue().encode()
                             st.download_button(
                                 label="💾 Download Chart",
                                 data=html_bytes,
@@ -573,12 +600,14 @@ def data_visualization_page():
 
 def comparison_page():
     """Data comparison page for previous month analysis"""
+    from helpers.comparison import calculate_comparison_summary, calculate_comparison_metrics
+    
     st.title("📊 Month-over-Month Comparison")
     
     # Option to choose between sample data or upload
     comp_data_source = st.radio(
         "Select Data Source:",
-        ["📂 Use Sample Data", "💻 Upload from Local Machine"],
+        ["📂 Use Sample Data", "💻 Upload from Local Machine", "🔁 Use Loaded Data"],
         horizontal=True,
         key="comparison_source"
     )
@@ -591,69 +620,77 @@ def comparison_page():
     if comp_data_source == "📂 Use Sample Data":
         st.info("📌 Compare August vs September, or September vs October")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.header("📅 Previous Month")
-            prev_sample = st.selectbox(
-                "Select previous month:",
-                ["August 2025", "September 2025"],
-                key="prev_month"
-            )
-        
-        with col2:
-            st.header("📅 Current Month")
-            curr_sample = st.selectbox(
-                "Select current month:",
-                ["September 2025", "October 2025"],
-                key="curr_month"
-            )
+        with st.form("comparison_sample_form", border=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.header("📅 Previous Month")
+                prev_sample = st.selectbox(
+                    "Select previous month:",
+                    ["August 2025", "September 2025"],
+                    key="prev_month"
+                )
+            
+            with col2:
+                st.header("📅 Current Month")
+                curr_sample = st.selectbox(
+                    "Select current month:",
+                    ["September 2025", "October 2025"],
+                    key="curr_month"
+                )
+            
+            load_clicked = st.form_submit_button("Load Sample Data for Comparison", type="primary")
         
-        if st.button("Load Sample Data for Comparison", type="primary"):
+        if load_clicked:
             try:
-                sample_map = {
-                    "August 2025": "SampleData/Aug.csv",
-                    "September 2025": "SampleData/Sep.csv",
-                    "October 2025": "SampleData/Oct.csv"
-                }
-                previous_df = pd.read_csv(sample_map[prev_sample])
-                current_df = pd.read_csv(sample_map[curr_sample])
+                previous_df = load_sample_file(SAMPLE_FILES[prev_sample])
+                current_df = load_sample_file(SAMPLE_FILES[curr_sample])
                 current_file = "sample"
                 previous_file = "sample"
                 st.success(f"✅ Loaded {prev_sample} vs {curr_sample}")
             except Exception as e:
                 st.error(f"Error loading sample data: {str(e)}")
+    elif comp_data_source == "🔁 Use Loaded Data":
+        # Datasets already loaded on the Data Visualization page; nothing is parsed again
+        if st.session_state.data is not None and st.session_state.previous_data is not None:
+            current_df = st.session_state.data
+            previous_df = st.session_state.previous_data
+            st.info("📌 Comparing the dataset loaded on the Data Visualization page against the one it replaced")
+        else:
+            st.info("👈 Load two datasets one after the other on the Data Visualization page to compare them here")
     else:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.header("📅 Current Month Data")
-            current_file = st.file_uploader(
-                "Upload current month data",
-                type=['csv', 'xlsx', 'xls'],
-                key="current"
-            )
-        
-        with col2:
-            st.header("📅 Previous Month Data")
-            previous_file = st.file_uploader(
-                "Upload previous month data",
-                type=['csv', 'xlsx', 'xls'],
-                key="previous"
-            )
+        # Both files are handed over together, so the first upload does not
+        # trigger a rerun on its own
+        with st.form("comparison_upload_form", border=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.header("📅 Current Month Data")
+                current_file = st.file_uploader(
+                    "Upload current month data",
+                    type=['csv', 'xlsx', 'xls'],
+                    key="current"
+                )
+            
+            with col2:
+                st.header("📅 Previous Month Data")
+                previous_file = st.file_uploader(
+                    "Upload previous month data",
+                    type=['csv', 'xlsx', 'xls'],
+                    key="previous"
+                )
+            
+            st.form_submit_button("Compare", type="primary")
         
         if current_file and previous_file:
             try:
-                # Read files
-                if current_file.name.endswith('.csv'):
-                    current_df = pd.read_csv(current_file)
-                else:
-                    current_df = pd.read_excel(current_file)
-                
-                if previous_file.name.endswith('.csv'):
-                    previous_df = pd.read_csv(previous_file)
-                else:
-                    previous_df = pd.read_excel(previous_file)
+                # The parsed pair is kept in the session, so reruns with the same
+                # uploads skip hashing the bytes and copying frames out of the cache
+                file_ids = (current_file.file_id, previous_file.file_id)
+                if st.session_state.comparison_upload is None or st.session_state.comparison_upload[0] != file_ids:
+                    # Read both files in parallel (each parsed once per distinct upload)
+                    st.session_state.comparison_upload = (file_ids, *load_uploaded_files(current_file, previous_file))
+                _, current_df, previous_df = st.session_state.comparison_upload
                 
                 st.success("✅ Both files loaded successfully!")
             except Exception as e:
@@ -670,80 +707,48 @@ def comparison_page():
                 st.markdown("---")
                 st.header("📈 Comparative Analysis")
                 
-                # Summary comparison using helpers
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    change = calculate_overall_change(current_df, previous_df, common_numeric)
-                    st.markdown(f"""
-                        <div class='metric-card'>
-                            <h3>{change:+.2f}%</h3>
-                            <p>Overall Change</p>
-                        </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown(f"""
-                        <div class='metric-card'>
-                            <h3>{len(common_numeric)}</h3>
-                            <p>Metrics Compared</p>
-                        </div>
-                    """, unsafe_allow_html=True)
-                
-                with col3:
-                    avg_change = calculate_average_difference(current_df, previous_df, common_numeric)
-                    st.markdown(f"""
-                        <div class='metric-card'>
-                            <h3>{avg_change:+.2f}</h3>
-                            <p>Avg Difference</p>
-                        </div>
-                    """, unsafe_allow_html=True)
+                # Summary comparison using helpers; one aggregation per dataset
+                # feeds the cards and the per-metric changes below
+                metrics = calculate_comparison_metrics(current_df, previous_df, common_numeric)
+                render_metric_row([
+                    (f"{metrics['overall_change']:+.2f}%", "Overall Change"),
+                    (len(common_numeric), "Metrics Compared"),
+                    (f"{metrics['average_difference']:+.2f}", "Avg Difference")
+                ])
                 
                 st.markdown("---")
                 
                 # Detailed comparisons for each metric
-                for col in common_numeric[:5]:  # Show top 5 metrics
-                    st.subheader(f"📊 {col} Comparison")
-                    
-                    # Create comparison chart using helper
-                    fig = create_comparison_chart(current_df, previous_df, col)
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Calculate and show change using helper
-                    change = calculate_metric_change(current_df, previous_df, col)
+                top_metrics = common_numeric[:5]  # Show top 5 metrics
+                metric_changes = metrics['metric_changes']
+                
+                # One subplot figure for all metrics, built from the precomputed totals
+                comparison_fig, html_bytes = get_cached_comparison_overview(tuple(
+                    (col, float(metrics['previous_totals'][col]), float(metrics['current_totals'][col]))
+                    for col in top_metrics
+                ))
+                render_chart(comparison_fig)
+                
+                # Show the precomputed changes
+                for col in top_metrics:
+                    change = metric_changes[col]
                     
                     if change > 0:
-                        st.success(f"📈 Increase of {change:.2f}%")
+                        st.success(f"📈 {col}: Increase of {change:.2f}%")
                     elif change < 0:
-                        st.error(f"📉 Decrease of {abs(change):.2f}%")
+                        st.error(f"📉 {col}: Decrease of {abs(change):.2f}%")
                     else:
-                        st.info("➡️ No change")
-                    
-                    # Download button for this comparison
-                    col_a, col_b, col_c = st.columns([3, 1, 3])
-                    with col_b:
-                        buffer = io.StringIO()
-                        fig.write_html(buffer)
-                        html_bytes = buffer.getvalue().encode()
-                        
-                        st.download_button(
-                            label="💾 Download",
-                            data=html_bytes,
-                            file_name=f"comparison_{col}.html",
-                            mime="text/html",
-                            use_container_width=True,
-                            key=f"download_{col}"
-                        )
-                    
-                    st.markdown("---")
+                        st.info(f"➡️ {col}: No change")
+                
+                st.markdown("---")
                 
                 # Download comparison summary
                 st.header("💾 Download Comparison Report")
                 
-                col1, col2 = st.columns(2)
+                col1, col2, col3 = st.columns(3)
+                csv, excel_data = get_cached_summary_exports(summary)
                 
                 with col1:
-                    csv = summary.to_csv(index=False).encode('utf-8')
                     st.download_button(
                         label="📥 Download Summary (CSV)",
                         data=csv,
@@ -753,11 +758,6 @@ def comparison_page():
                     )
                 
                 with col2:
-                    output = io.BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        summary.to_excel(writer, index=False, sheet_name='Comparison')
-                    excel_data = output.getvalue()
-                    
                     st.download_button(
                         label="📥 Download Summary (Excel)",
                         data=excel_data,
@@ -765,6 +765,16 @@ def comparison_page():
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         use_container_width=True
                     )
+                
+                with col3:
+                    # The comparison figure as a CDN-backed HTML page
+                    st.download_button(
+                        label="📥 Download All Charts (HTML)",
+                        data=html_bytes,
+                        file_name="comparison_charts.html",
+                        mime="text/html",
+                        use_container_width=True
+                    )
             
             else:
                 st.warning("⚠️ No common numeric columns found between the two datasets")
@@ -776,246 +786,233 @@ def comparison_page():
         st.info("👆 Please upload both current and previous month data files to begin comparison")
 
 
+# Static About page content, built once at import
+_ABOUT_OVERVIEW = """
+**FlowViz** is a comprehensive **Industry Data Analytics Platform** designed to help businesses 
+gain actionable insights from their operational data. Built with Python and Streamlit, FlowViz 
+provides powerful visualization and analysis tools without requiring any coding knowledge.
+
+### 🎯 Key Features:
+- **📊 Data Visualization**: Interactive charts and graphs with multiple visualization types
+- **💼 CEO Dashboard**: Executive-level KPIs and business performance metrics
+- **🎨 Custom Chart Builder**: Create custom visualizations with drag-and-drop simplicity
+- **📈 Month Comparison**: Compare performance across different time periods
+- **🤖 ML Insights**: Automated recommendations based on data patterns
+- **📥 Sample Data**: Pre-loaded datasets for quick testing and exploration
+"""
+
+_ABOUT_PRIVACY = """
+### Your Data is Safe and Private
+
+We take data privacy seriously. Here's what you need to know:
+
+✅ **No Data Storage**: This application **does not store any of your data** on our servers or databases. 
+All data processing happens in your browser session only.
+
+✅ **Session-Based Processing**: Your uploaded data exists only in your active session. When you logout 
+or close the browser, your session's data is cleared; parsed copies cached to speed up reruns are 
+evicted as new files arrive and expire from server memory within an hour.
+
+✅ **No Third-Party Sharing**: We do not share, sell, or transmit your data to any third parties.
+
+✅ **Local Processing**: All computations and visualizations are performed locally within the application 
+runtime. No data leaves your session.
+
+✅ **Secure Connection**: The application uses standard web security protocols to protect data in transit.
+
+### 📊 Sole Purpose: Data Visualization
+
+FlowViz is designed with **one primary goal**: to help you **visualize and analyze your data**. 
+We provide the tools, you maintain full control of your information.
+"""
+
+_ABOUT_USAGE = [
+    """
+    ### 🚀 Getting Started
+    1. **Login** with your credentials
+    2. Navigate to **Data Visualization**
+    3. **Upload your CSV file** or use sample data
+    4. Explore different visualization options
+    5. Access specialized dashboards as needed
+    """,
+    """
+    ### 💡 Best Practices
+    - Use CSV files with clear column headers
+    - Ensure date columns are properly formatted
+    - Include numeric columns for metrics
+    - Use sample data to test features first
+    - Download charts for reports/presentations
+    """
+]
+
+_ABOUT_TECHNICAL = [
+    """
+    **Version**  
+    FlowViz v1.0
+
+    **Framework**  
+    Streamlit
+    """,
+    """
+    **Language**  
+    Python 3.12
+
+    **Libraries**  
+    Pandas, Plotly, NumPy
+    """,
+    """
+    **License**  
+    Open Source
+
+    **Platform**  
+    Industry Data Analytics
+    """
+]
+
+_ABOUT_SUPPORT = """
+Have questions or suggestions? We'd love to hear from you!
+
+- 📝 **Documentation**: Check the README and QUICKREF files in the repository
+- 🐛 **Report Issues**: Submit bug reports through the issue tracker
+- 💬 **Feature Requests**: Share your ideas for improvements
+- ⭐ **Star the Project**: Show your support on GitHub
+"""
+
+_ABOUT_FOOTER = """
+<div style='text-align: center; color: #7f8c8d; padding: 20px;'>
+    <p><strong>FlowViz - Industry Data Analytics Platform</strong></p>
+    <p>Empowering businesses with data-driven insights</p>
+    <p>© 2025 FlowViz. Built with ❤️ using Streamlit</p>
+</div>
+"""
+
+
 def about_page():
     """About page with app information and data privacy policy"""
     st.title("ℹ️ About FlowViz")
     
     # App Overview
     st.header("📱 Application Overview")
-    st.markdown("""
-    **FlowViz** is a comprehensive **Industry Data Analytics Platform** designed to help businesses 
-    gain actionable insights from their operational data. Built with Python and Streamlit, FlowViz 
-    provides powerful visualization and analysis tools without requiring any coding knowledge.
-    
-    ### 🎯 Key Features:
-    - **📊 Data Visualization**: Interactive charts and graphs with multiple visualization types
-    - **💼 CEO Dashboard**: Executive-level KPIs and business performance metrics
-    - **🎨 Custom Chart Builder**: Create custom visualizations with drag-and-drop simplicity
-    - **📈 Month Comparison**: Compare performance across different time periods
-    - **🤖 ML Insights**: Automated recommendations based on data patterns
-    - **📥 Sample Data**: Pre-loaded datasets for quick testing and exploration
-    """)
+    st.markdown(_ABOUT_OVERVIEW)
     
     st.markdown("---")
     
     # Data Privacy & Security
     st.header("🔒 Data Privacy & Security")
-    st.markdown("""
-    ### Your Data is Safe and Private
-    
-    We take data privacy seriously. Here's what you need to know:
-    
-    ✅ **No Data Storage**: This application **does not store any of your data** on our servers or databases. 
-    All data processing happens in your browser session only.
-    
-    ✅ **Session-Based Processing**: Your uploaded data exists only in your active session. When you logout 
-    or close the browser, all data is immediately cleared from memory.
-    
-    ✅ **No Third-Party Sharing**: We do not share, sell, or transmit your data to any third parties.
-    
-    ✅ **Local Processing**: All computations and visualizations are performed locally within the application 
-    runtime. No data leaves your session.
-    
-    ✅ **Secure Connection**: The application uses standard web security protocols to protect data in transit.
-    
-    ### 📊 Sole Purpose: Data Visualization
-    
-    FlowViz is designed with **one primary goal**: to help you **visualize and analyze your data**. 
-    We provide the tools, you maintain full control of your information.
-    """)
+    st.markdown(_ABOUT_PRIVACY)
     
     st.markdown("---")
     
     # Usage Guidelines
     st.header("📖 How to Use FlowViz")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        ### 🚀 Getting Started
-        1. **Login** with your credentials
-        2. Navigate to **Data Visualization**
-        3. **Upload your CSV file** or use sample data
-        4. Explore different visualization options
-        5. Access specialized dashboards as needed
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 💡 Best Practices
-        - Use CSV files with clear column headers
-        - Ensure date columns are properly formatted
-        - Include numeric columns for metrics
-        - Use sample data to test features first
-        - Download charts for reports/presentations
-        """)
+    for col, section in zip(st.columns(2), _ABOUT_USAGE):
+        with col:
+            st.markdown(section)
     
     st.markdown("---")
     
     # Technical Information
     st.header("⚙️ Technical Details")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **Version**  
-        FlowViz v1.0
-        
-        **Framework**  
-        Streamlit
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Language**  
-        Python 3.12
-        
-        **Libraries**  
-        Pandas, Plotly, NumPy
-        """)
-    
-    with col3:
-        st.markdown("""
-        **License**  
-        Open Source
-        
-        **Platform**  
-        Industry Data Analytics
-        """)
+    for col, section in zip(st.columns(3), _ABOUT_TECHNICAL):
+        with col:
+            st.markdown(section)
     
     st.markdown("---")
     
     # Support & Contact
     st.header("📧 Support & Feedback")
-    st.markdown("""
-    Have questions or suggestions? We'd love to hear from you!
-    
-    - 📝 **Documentation**: Check the README and QUICKREF files in the repository
-    - 🐛 **Report Issues**: Submit bug reports through the issue tracker
-    - 💬 **Feature Requests**: Share your ideas for improvements
-    - ⭐ **Star the Project**: Show your support on GitHub
-    """)
+    st.markdown(_ABOUT_SUPPORT)
     
     st.markdown("---")
     
     # Footer
-    st.markdown("""
-    <div style='text-align: center; color: #7f8c8d; padding: 20px;'>
-        <p><strong>FlowViz - Industry Data Analytics Platform</strong></p>
-        <p>Empowering businesses with data-driven insights</p>
-        <p>© 2025 FlowViz. Built with ❤️ using Streamlit</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ABOUT_FOOTER, unsafe_allow_html=True)
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_cached_revenue_trend(df_hash: str, _df: pd.DataFrame):
+    """Revenue trend for the CEO dashboard, cached on the dataset fingerprint"""
+    from helpers.ceo_dashboard import create_revenue_trend
+    return create_revenue_trend(_df)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_cached_ceo_breakdown(df_hash: str, _df: pd.DataFrame) -> dict:
+    """Breakdown figures for the CEO dashboard, cached on the dataset fingerprint"""
+    from helpers.ceo_dashboard import (
+        create_regional_product_overview,
+        create_efficiency_metrics,
+        create_promotion_and_top_products
+    )
+    return {
+        'regional_product_mix': create_regional_product_overview(_df),
+        'efficiency_metrics': create_efficiency_metrics(_df),
+        'promotion_top_products': create_promotion_and_top_products(_df, top_n=8)
+    }
+
+
+@requires_data("📊 CEO Dashboard - Business Overview")
 def ceo_dashboard_page():
     """CEO Dashboard with high-level business metrics"""
-    st.title("📊 CEO Dashboard - Business Overview")
-    
-    if st.session_state.data is None:
-        st.warning("⚠️ Please load data first from the Data Visualization page")
-        return
-    
-    df = st.session_state.data
-    
-    # Calculate KPIs
-    kpis = create_kpi_cards(df)
+    # KPIs are computed when the data is loaded; charts are only rebuilt
+    # when the dataset changes
+    kpis = st.session_state.kpis
     
     # Display KPI Cards
     st.header("🎯 Key Performance Indicators")
     cols = st.columns(4)
     
+    # Native metric tiles, styled like the metric cards in static/flowviz.css
     with cols[0]:
         if 'total_revenue' in kpis:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <h3>${kpis['total_revenue']:,.0f}</h3>
-                    <p>Total Revenue</p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.metric("Total Revenue", f"${kpis['total_revenue']:,.0f}")
     
     with cols[1]:
         if 'total_transactions' in kpis:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <h3>{kpis['total_transactions']:,}</h3>
-                    <p>Total Transactions</p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.metric("Total Transactions", f"{kpis['total_transactions']:,}")
     
     with cols[2]:
         if 'avg_transaction' in kpis:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <h3>${kpis['avg_transaction']:.2f}</h3>
-                    <p>Avg Transaction Value</p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.metric("Avg Transaction Value", f"${kpis['avg_transaction']:.2f}")
     
     with cols[3]:
         if 'revenue_per_hour' in kpis:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <h3>${kpis['revenue_per_hour']:.2f}</h3>
-                    <p>Revenue per Hour</p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.metric("Revenue per Hour", f"${kpis['revenue_per_hour']:.2f}")
     
     st.markdown("---")
     
     # Revenue Trend
-    fig = create_revenue_trend(df)
+    fig = get_cached_revenue_trend(st.session_state.data_hash, st.session_state.data)
     if fig:
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Two columns for regional and product mix
-    col1, col2 = st.columns(2)
+        render_chart(fig)
     
-    with col1:
-        fig = create_regional_performance(df)
-        if fig:
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        fig = create_product_mix(df)
-        if fig:
-            st.plotly_chart(fig, use_container_width=True)
-    
-    # Efficiency metrics
-    fig = create_efficiency_metrics(df)
-    if fig:
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Two columns for promotion impact and top products
-    col1, col2 = st.columns(2)
+    # The breakdown charts are only built and sent once the user asks for
+    # them (an expander would still run its contents on every load)
+    if not st.toggle("Show Regional / Product / Efficiency / Promotion Breakdown", key="ceo_breakdown"):
+        return
     
-    with col1:
-        fig = create_promotion_impact(df)
-        if fig:
-            st.plotly_chart(fig, use_container_width=True)
+    dashboard = get_cached_ceo_breakdown(st.session_state.data_hash, st.session_state.data)
     
-    with col2:
-        fig = create_top_products(df, top_n=8)
+    # Paired charts share one figure each, so the browser initializes
+    # three plots instead of five
+    for key in ('regional_product_mix', 'efficiency_metrics', 'promotion_top_products'):
+        fig = dashboard[key]
         if fig:
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
 
 
+@requires_data("🎨 Custom Chart Builder")
 def custom_charts_page():
     """Custom chart builder page"""
-    st.title("🎨 Custom Chart Builder")
-    
-    if st.session_state.data is None:
-        st.warning("⚠️ Please load data first from the Data Visualization page")
-        return
+    from helpers.custom_charts import create_custom_heatmap
     
     df = st.session_state.data
     
     st.info("📌 Create custom visualizations by selecting columns and chart types")
     
     # Get column types
-    col_types = get_column_types(df)
+    col_types = get_cached_column_types(st.session_state.data_hash, df)
     
     # Display available columns
     with st.expander("📋 Available Columns", expanded=False):
@@ -1041,114 +1038,172 @@ def custom_charts_page():
     
     st.markdown("---")
     
-    # Dynamic form based on chart type
+    # Dynamic form based on chart type; widgets inside a form only rerun the
+    # page on submit, and the generated figure is kept in session state so
+    # unrelated reruns redisplay it instead of rebuilding it
+    data_hash = st.session_state.data_hash
+    fig_key = f"fig_{chart_type}"
+    fig = None
+    
     if chart_type == "Line Chart":
-        st.subheader("📈 Line Chart Configuration")
-        x_col = st.selectbox("X-Axis (Date/Categorical):", 
-                            col_types['date'] + col_types['categorical'] + col_types['numeric'])
-        y_cols = st.multiselect("Y-Axis (Numeric - select one or more):", 
-                               col_types['numeric'])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("line_chart_form", border=False):
+            st.subheader("📈 Line Chart Configuration")
+            x_col = st.selectbox("X-Axis (Date/Categorical):", 
+                                col_types['date'] + col_types['categorical'] + col_types['numeric'])
+            y_cols = st.multiselect("Y-Axis (Numeric - select one or more):", 
+                                   col_types['numeric'])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Line Chart", type="primary")
         
-        if st.button("Generate Line Chart", type="primary") and y_cols:
-            fig = create_custom_line_chart(df, x_col, y_cols, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+        if submitted and y_cols:
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_line_chart',
+                                          (x_col, y_cols, title or None))
     
     elif chart_type == "Bar Chart":
-        st.subheader("📊 Bar Chart Configuration")
-        x_col = st.selectbox("Category Column:", 
-                            col_types['categorical'] + col_types['date'])
-        y_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
-        orientation = st.radio("Orientation:", ["Vertical", "Horizontal"])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("bar_chart_form", border=False):
+            st.subheader("📊 Bar Chart Configuration")
+            x_col = st.selectbox("Category Column:", 
+                                col_types['categorical'] + col_types['date'])
+            y_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
+            orientation = st.radio("Orientation:", ["Vertical", "Horizontal"])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Bar Chart", type="primary")
         
-        if st.button("Generate Bar Chart", type="primary"):
+        if submitted:
             orient = 'h' if orientation == "Horizontal" else 'v'
-            fig = create_custom_bar_chart(df, x_col, y_col, orient, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_bar_chart',
+                                          (x_col, y_col, orient, title or None))
     
     elif chart_type == "Scatter Plot":
-        st.subheader("🔵 Scatter Plot Configuration")
-        x_col = st.selectbox("X-Axis:", col_types['numeric'])
-        y_col = st.selectbox("Y-Axis:", col_types['numeric'])
-        color_col = st.selectbox("Color by (optional):", 
-                                ["None"] + col_types['categorical'])
-        size_col = st.selectbox("Size by (optional):", 
-                               ["None"] + col_types['numeric'])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("scatter_plot_form", border=False):
+            st.subheader("🔵 Scatter Plot Configuration")
+            x_col = st.selectbox("X-Axis:", col_types['numeric'])
+            y_col = st.selectbox("Y-Axis:", col_types['numeric'])
+            color_col = st.selectbox("Color by (optional):", 
+                                    ["None"] + col_types['categorical'])
+            size_col = st.selectbox("Size by (optional):", 
+                                   ["None"] + col_types['numeric'])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Scatter Plot", type="primary")
         
-        if st.button("Generate Scatter Plot", type="primary"):
+        if submitted:
             color = None if color_col == "None" else color_col
             size = None if size_col == "None" else size_col
-            fig = create_custom_scatter(df, x_col, y_col, color, size, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_scatter',
+                                          (x_col, y_col, color, size, title or None))
     
     elif chart_type == "Pie Chart":
-        st.subheader("🥧 Pie Chart Configuration")
-        names_col = st.selectbox("Category Column:", col_types['categorical'])
-        values_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("pie_chart_form", border=False):
+            st.subheader("🥧 Pie Chart Configuration")
+            names_col = st.selectbox("Category Column:", col_types['categorical'])
+            values_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Pie Chart", type="primary")
         
-        if st.button("Generate Pie Chart", type="primary"):
-            fig = create_custom_pie_chart(df, names_col, values_col, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+        if submitted:
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_pie_chart',
+                                          (names_col, values_col, title or None))
     
     elif chart_type == "Box Plot":
-        st.subheader("📦 Box Plot Configuration")
-        category_col = st.selectbox("Category Column:", col_types['categorical'])
-        value_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("box_plot_form", border=False):
+            st.subheader("📦 Box Plot Configuration")
+            category_col = st.selectbox("Category Column:", col_types['categorical'])
+            value_col = st.selectbox("Value Column (Numeric):", col_types['numeric'])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Box Plot", type="primary")
         
-        if st.button("Generate Box Plot", type="primary"):
-            fig = create_custom_box_plot(df, category_col, value_col, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+        if submitted:
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_box_plot',
+                                          (category_col, value_col, title or None))
     
     elif chart_type == "Correlation Heatmap":
-        st.subheader("🔥 Correlation Heatmap Configuration")
         if len(col_types['numeric']) >= 2:
-            selected_cols = st.multiselect("Select Numeric Columns (min 2):", 
-                                          col_types['numeric'],
-                                          default=col_types['numeric'][:5])
-            title = st.text_input("Chart Title (optional):", "")
+            with st.form("heatmap_form", border=False):
+                st.subheader("🔥 Correlation Heatmap Configuration")
+                selected_cols = st.multiselect("Select Numeric Columns (min 2):", 
+                                              col_types['numeric'],
+                                              default=col_types['numeric'][:5])
+                title = st.text_input("Chart Title (optional):", "")
+                submitted = st.form_submit_button("Generate Heatmap", type="primary")
             
-            if st.button("Generate Heatmap", type="primary") and len(selected_cols) >= 2:
-                fig = create_custom_heatmap(df, selected_cols, title or None)
-                st.plotly_chart(fig, use_container_width=True)
+            if submitted and len(selected_cols) >= 2:
+                # Pairwise correlations are computed once per dataset and sliced here
+                full_corr = get_cached_correlation(data_hash, df, tuple(col_types['numeric']))
+                fig = create_custom_heatmap(df, selected_cols, title or None, corr_matrix=full_corr)
         else:
+            st.subheader("🔥 Correlation Heatmap Configuration")
             st.warning("Need at least 2 numeric columns for correlation heatmap")
     
     elif chart_type == "Area Chart":
-        st.subheader("📊 Area Chart Configuration")
-        x_col = st.selectbox("X-Axis:", col_types['date'] + col_types['categorical'])
-        y_cols = st.multiselect("Y-Axis (Numeric - select one or more):", 
-                               col_types['numeric'])
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("area_chart_form", border=False):
+            st.subheader("📊 Area Chart Configuration")
+            x_col = st.selectbox("X-Axis:", col_types['date'] + col_types['categorical'])
+            y_cols = st.multiselect("Y-Axis (Numeric - select one or more):", 
+                                   col_types['numeric'])
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Area Chart", type="primary")
         
-        if st.button("Generate Area Chart", type="primary") and y_cols:
-            fig = create_custom_area_chart(df, x_col, y_cols, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+        if submitted and y_cols:
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_area_chart',
+                                          (x_col, y_cols, title or None))
     
     elif chart_type == "Histogram":
-        st.subheader("📊 Histogram Configuration")
-        column = st.selectbox("Select Column:", col_types['numeric'])
-        bins = st.slider("Number of Bins:", 10, 100, 30)
-        title = st.text_input("Chart Title (optional):", "")
+        with st.form("histogram_form", border=False):
+            st.subheader("📊 Histogram Configuration")
+            column = st.selectbox("Select Column:", col_types['numeric'])
+            bins = st.slider("Number of Bins:", 10, 100, 30)
+            title = st.text_input("Chart Title (optional):", "")
+            submitted = st.form_submit_button("Generate Histogram", type="primary")
         
-        if st.button("Generate Histogram", type="primary"):
-            fig = create_custom_histogram(df, column, bins, title or None)
-            st.plotly_chart(fig, use_container_width=True)
+        if submitted:
+            fig = get_cached_custom_chart(data_hash, df, 'create_custom_histogram',
+                                          (column, bins, title or None))
+    
+    if fig is not None:
+        st.session_state[fig_key] = (data_hash, fig)
+    
+    # Show the last chart generated for this chart type until the data changes
+    stored = st.session_state.get(fig_key)
+    if stored is not None and stored[0] == data_hash:
+        render_chart(stored[1])
+
 
+def logout():
+    """Clear the user's session; used as the logout button callback"""
+    st.session_state.logged_in = False
+    st.session_state.username = ''
+    st.session_state.data = None
+    st.session_state.data_hash = None
+    st.session_state.file_hash = None
+    st.session_state.kpis = None
+    st.session_state.previous_data = None
+    st.session_state.comparison_upload = None
 
 def main():
     """Main application logic"""
     
     if not st.session_state.logged_in:
-        login_page()
+        st.navigation([st.Page(login_page, title="Login", url_path="login")], position="hidden").run()
     else:
+        # Warm the sample data cache so "Load Sample Data" returns immediately
+        prefetch_sample_files()
+        
+        # Native multipage routing: a page switch is a single rerun
+        pages = [
+            st.Page(home_page, title="Home", icon="🏠", url_path="home", default=True),
+            st.Page(data_visualization_page, title="Data Visualization", icon="📊", url_path="visualization"),
+            st.Page(ceo_dashboard_page, title="CEO Dashboard", icon="💼", url_path="ceo_dashboard"),
+            st.Page(custom_charts_page, title="Custom Charts", icon="🎨", url_path="custom_charts"),
+            st.Page(comparison_page, title="Month Comparison", icon="📈", url_path="comparison"),
+            st.Page(about_page, title="About", icon="ℹ️", url_path="about")
+        ]
+        # Links are drawn below the logo and user info instead of Streamlit's default menu
+        current_page = st.navigation(pages, position="hidden")
+        
         # Sidebar navigation
         with st.sidebar:
             # Logo at top of sidebar
-            st.image("logo/flowviz_logo.png", width=100)
+            st.image(load_logo(), width=100)
             st.title("🧭 Navigation")
             st.markdown("---")
             
@@ -1157,49 +1212,20 @@ def main():
             st.markdown("---")
             
             # Navigation menu
-            menu_options = {
-                "🏠 Home": "home",
-                "📊 Data Visualization": "visualization",
-                "💼 CEO Dashboard": "ceo_dashboard",
-                "🎨 Custom Charts": "custom_charts",
-                "📈 Month Comparison": "comparison",
-                "ℹ️ About": "about"
-            }
-            
-            for label, page in menu_options.items():
-                if st.button(label, use_container_width=True):
-                    st.session_state.page = page
-                    st.rerun()
+            for page in pages:
+                st.page_link(page, use_container_width=True)
             
             st.markdown("---")
             
             # Logout button
-            if st.button("🚪 Logout", use_container_width=True):
-                st.session_state.logged_in = False
-                st.session_state.username = ''
-                st.session_state.page = 'login'
-                st.session_state.data = None
-                st.session_state.previous_data = None
-                st.rerun()
+            # The callback runs before the click's rerun, which then draws the login page
+            st.button("🚪 Logout", use_container_width=True, on_click=logout)
             
             st.markdown("---")
-            st.markdown("### ℹ️ About")
-            st.markdown("FlowViz v1.0")
-            st.markdown("Industry Data Analytics Platform")
+            st.markdown(_SIDEBAR_ABOUT)
         
         # Display selected page
-        if st.session_state.page == 'home':
-            home_page()
-        elif st.session_state.page == 'visualization':
-            data_visualization_page()
-        elif st.session_state.page == 'ceo_dashboard':
-            ceo_dashboard_page()
-        elif st.session_state.page == 'custom_charts':
-            custom_charts_page()
-        elif st.session_state.page == 'comparison':
-            comparison_page()
-        elif st.session_state.page == 'about':
-            about_page()
+        current_page.run()
 
 if __name__ == "__main__":
     main()
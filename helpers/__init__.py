@@ -1,53 +1,62 @@
 """
 FlowViz Helper Modules
 Modular utilities for industrial data analysis
+
+Submodules are imported on first use, so importing one helper
+(e.g. helpers.data_io) does not pull in Plotly.
 """
 
-from .datetime_utils import detect_datetime_format
-from .ml_analysis import analyze_data_with_ml
-from .visualizations import create_visualization
-from .comparison import create_comparison_chart, calculate_comparison_summary
-from .ceo_dashboard import (
-    create_kpi_cards,
-    create_revenue_trend,
-    create_regional_performance,
-    create_product_mix,
-    create_efficiency_metrics,
-    create_promotion_impact,
-    create_top_products
-)
-from .custom_charts import (
-    get_column_types,
-    create_custom_line_chart,
-    create_custom_bar_chart,
-    create_custom_scatter,
-    create_custom_pie_chart,
-    create_custom_box_plot,
-    create_custom_heatmap,
-    create_custom_area_chart,
-    create_custom_histogram
-)
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'detect_datetime_format': 'datetime_utils',
+    'read_uploaded_file': 'data_io',
+    'read_sample_csv': 'data_io',
+    'to_csv_bytes': 'data_io',
+    'to_excel_bytes': 'data_io',
+    'to_parquet_bytes': 'data_io',
+    'dataframe_fingerprint': 'data_io',
+    'optimize_dtypes': 'data_io',
+    'analyze_data_with_ml': 'ml_analysis',
+    'fast_corr': 'ml_analysis',
+    'partition_columns': 'ml_analysis',
+    'create_visualization': 'visualizations',
+    'create_comparison_overview': 'comparison',
+    'calculate_comparison_summary': 'comparison',
+    'calculate_comparison_metrics': 'comparison',
+    'create_kpi_cards': 'ceo_dashboard',
+    'create_revenue_trend': 'ceo_dashboard',
+    'create_regional_performance': 'ceo_dashboard',
+    'create_product_mix': 'ceo_dashboard',
+    'create_efficiency_metrics': 'ceo_dashboard',
+    'create_promotion_impact': 'ceo_dashboard',
+    'create_top_products': 'ceo_dashboard',
+    'create_regional_product_overview': 'ceo_dashboard',
+    'create_promotion_and_top_products': 'ceo_dashboard',
+    'get_column_types': 'custom_charts',
+    'create_custom_line_chart': 'custom_charts',
+    'create_custom_bar_chart': 'custom_charts',
+    'create_custom_scatter': 'custom_charts',
+    'create_custom_pie_chart': 'custom_charts',
+    'create_custom_box_plot': 'custom_charts',
+    'create_custom_heatmap': 'custom_charts',
+    'create_custom_area_chart': 'custom_charts',
+    'create_custom_histogram': 'custom_charts',
+    'lttb_indices': 'figure_utils',
+    'downsample_figure': 'figure_utils',
+    'downsample_xy': 'figure_utils',
+    'to_webgl': 'figure_utils',
+    'scatter_trace_class': 'figure_utils',
+    'figure_to_html_bytes': 'figure_utils',
+    'figures_to_html_bytes': 'figure_utils'
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'detect_datetime_format',
-    'analyze_data_with_ml',
-    'create_visualization',
-    'create_comparison_chart',
-    'calculate_comparison_summary',
-    'create_kpi_cards',
-    'create_revenue_trend',
-    'create_regional_performance',
-    'create_product_mix',
-    'create_efficiency_metrics',
-    'create_promotion_impact',
-    'create_top_products',
-    'get_column_types',
-    'create_custom_line_chart',
-    'create_custom_bar_chart',
-    'create_custom_scatter',
-    'create_custom_pie_chart',
-    'create_custom_box_plot',
-    'create_custom_heatmap',
-    'create_custom_area_chart',
-    'create_custom_histogram'
-]
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,18 @@ CEO Dashboard visualizations for FlowViz
 High-level business metrics and KPIs
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import qualitative
 from plotly.subplots import make_subplots
+from ._backend import fast_sum
+from .figure_utils import downsample_xy, scatter_trace_class
+
+# Promotion bar colours by flag value; any other flag value gets OTHER_FLAG_COLOR
+PROMOTION_TOTAL_COLORS = {'No': '#ef4444', 'Yes': '#10b981'}
+PROMOTION_AVERAGE_COLORS = {'No': '#f59e0b', 'Yes': '#06b6d4'}
+OTHER_FLAG_COLOR = '#94a3b8'
 
 
 def create_kpi_cards(df: pd.DataFrame) -> dict:
@@ -21,22 +29,31 @@ def create_kpi_cards(df: pd.DataFrame) -> dict:
     """
     kpis = {}
     
+    # Every column is summed in one reduction; means follow from the counts
+    columns = [col for col in ('Sales_Amount', 'Quantity_Sold', 'Manpower_Hours', 'kWh_Used') if col in df.columns]
+    stats = None
+    if columns:
+        sums = fast_sum(df, columns)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / df[columns].count().to_numpy()
+        stats = pd.DataFrame([sums, means], index=['sum', 'mean'], columns=columns)
+    
     # Revenue metrics
-    if 'Sales_Amount' in df.columns:
-        kpis['total_revenue'] = df['Sales_Amount'].sum()
-        kpis['avg_transaction'] = df['Sales_Amount'].mean()
+    if 'Sales_Amount' in columns:
+        kpis['total_revenue'] = stats.at['sum', 'Sales_Amount']
+        kpis['avg_transaction'] = stats.at['mean', 'Sales_Amount']
     
     # Volume metrics
-    if 'Quantity_Sold' in df.columns:
-        kpis['total_units'] = df['Quantity_Sold'].sum()
-        kpis['avg_units_per_transaction'] = df['Quantity_Sold'].mean()
+    if 'Quantity_Sold' in columns:
+        kpis['total_units'] = stats.at['sum', 'Quantity_Sold']
+        kpis['avg_units_per_transaction'] = stats.at['mean', 'Quantity_Sold']
     
     # Efficiency metrics
-    if 'Manpower_Hours' in df.columns and 'Sales_Amount' in df.columns:
-        kpis['revenue_per_hour'] = df['Sales_Amount'].sum() / df['Manpower_Hours'].sum()
+    if 'Manpower_Hours' in columns and 'Sales_Amount' in columns:
+        kpis['revenue_per_hour'] = stats.at['sum', 'Sales_Amount'] / stats.at['sum', 'Manpower_Hours']
     
-    if 'kWh_Used' in df.columns and 'Sales_Amount' in df.columns:
-        kpis['revenue_per_kwh'] = df['Sales_Amount'].sum() / df['kWh_Used'].sum()
+    if 'kWh_Used' in columns and 'Sales_Amount' in columns:
+        kpis['revenue_per_kwh'] = stats.at['sum', 'Sales_Amount'] / stats.at['sum', 'kWh_Used']
     
     # Transaction count
     kpis['total_transactions'] = len(df)
@@ -49,17 +66,16 @@ def create_revenue_trend(df: pd.DataFrame, date_col: str = 'Date') -> go.Figure:
     if date_col not in df.columns or 'Sales_Amount' not in df.columns:
         return None
     
-    df_copy = df.copy()
-    df_copy[date_col] = pd.to_datetime(df_copy[date_col], errors='coerce')
-    df_sorted = df_copy.sort_values(date_col)
+    # Daily revenue; groupby sorts the dates, so only the two columns used are parsed
+    dates = pd.to_datetime(df[date_col], errors='coerce')
+    daily_revenue = df['Sales_Amount'].groupby(dates, observed=True).sum().reset_index()
     
-    # Daily revenue
-    daily_revenue = df_sorted.groupby(date_col)['Sales_Amount'].sum().reset_index()
+    x, y = downsample_xy(daily_revenue[date_col], daily_revenue['Sales_Amount'])
     
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=daily_revenue[date_col],
-        y=daily_revenue['Sales_Amount'],
+    fig.add_trace(scatter_trace_class(len(y))(
+        x=x,
+        y=y,
         mode='lines+markers',
         name='Daily Revenue',
         line=dict(color='#10b981', width=3),
@@ -71,7 +87,6 @@ def create_revenue_trend(df: pd.DataFrame, date_col: str = 'Date') -> go.Figure:
         title='Revenue Trend',
         xaxis_title='Date',
         yaxis_title='Revenue ($)',
-        template='plotly_white',
         hovermode='x unified'
     )
     
@@ -83,7 +98,7 @@ def create_regional_performance(df: pd.DataFrame) -> go.Figure:
     if 'Region' not in df.columns or 'Sales_Amount' not in df.columns:
         return None
     
-    regional_sales = df.groupby('Region')['Sales_Amount'].sum().reset_index()
+    regional_sales = df.groupby('Region', observed=True, sort=False)['Sales_Amount'].sum().reset_index()
     regional_sales = regional_sales.sort_values('Sales_Amount', ascending=True)
     
     fig = go.Figure()
@@ -96,15 +111,14 @@ def create_regional_performance(df: pd.DataFrame) -> go.Figure:
             colorscale='Viridis',
             showscale=True
         ),
-        text=regional_sales['Sales_Amount'].apply(lambda x: f'${x:,.0f}'),
+        texttemplate='$%{x:,.0f}',
         textposition='auto'
     ))
     
     fig.update_layout(
         title='Regional Sales Performance',
         xaxis_title='Total Sales ($)',
-        yaxis_title='Region',
-        template='plotly_white'
+        yaxis_title='Region'
     )
     
     return fig
@@ -115,21 +129,25 @@ def create_product_mix(df: pd.DataFrame) -> go.Figure:
     if 'Product_Category' not in df.columns or 'Sales_Amount' not in df.columns:
         return None
     
-    category_sales = df.groupby('Product_Category')['Sales_Amount'].sum().reset_index()
+    category_sales = df.groupby('Product_Category', observed=True)['Sales_Amount'].sum()
+    
+    # Colours are keyed by category name, so a category keeps its colour
+    # whatever order the groups come back in
+    palette = {label: qualitative.Set3[i % len(qualitative.Set3)]
+               for i, label in enumerate(sorted(category_sales.index.astype(str)))}
     
     fig = go.Figure()
     fig.add_trace(go.Pie(
-        labels=category_sales['Product_Category'],
-        values=category_sales['Sales_Amount'],
+        labels=category_sales.index,
+        values=category_sales.to_numpy(),
         hole=0.4,
-        marker=dict(colors=px.colors.qualitative.Set3),
+        marker=dict(colors=[palette[str(label)] for label in category_sales.index]),
         textinfo='label+percent',
         textposition='auto'
     ))
     
     fig.update_layout(
-        title='Revenue by Product Category',
-        template='plotly_white'
+        title='Revenue by Product Category'
     )
     
     return fig
@@ -140,50 +158,46 @@ def create_efficiency_metrics(df: pd.DataFrame) -> go.Figure:
     if 'Store_Type' not in df.columns:
         return None
     
-    metrics = []
-    store_types = df['Store_Type'].unique()
-    
     fig = make_subplots(
         rows=1, cols=3,
         subplot_titles=('Revenue per Hour', 'Revenue per kWh', 'Avg Transaction Value'),
         specs=[[{'type': 'bar'}, {'type': 'bar'}, {'type': 'bar'}]]
     )
     
-    if 'Manpower_Hours' in df.columns and 'Sales_Amount' in df.columns:
-        efficiency = df.groupby('Store_Type').apply(
-            lambda x: x['Sales_Amount'].sum() / x['Manpower_Hours'].sum()
-        ).reset_index(name='Revenue_per_Hour')
-        
-        fig.add_trace(
-            go.Bar(x=efficiency['Store_Type'], y=efficiency['Revenue_per_Hour'], 
-                   marker_color='#10b981', name='$/Hour'),
-            row=1, col=1
-        )
-    
-    if 'kWh_Used' in df.columns and 'Sales_Amount' in df.columns:
-        energy_eff = df.groupby('Store_Type').apply(
-            lambda x: x['Sales_Amount'].sum() / x['kWh_Used'].sum()
-        ).reset_index(name='Revenue_per_kWh')
-        
-        fig.add_trace(
-            go.Bar(x=energy_eff['Store_Type'], y=energy_eff['Revenue_per_kWh'],
-                   marker_color='#06b6d4', name='$/kWh'),
-            row=1, col=2
-        )
+    # Panels are collected and added to the subplot grid in one call
+    traces, cols = [], []
     
     if 'Sales_Amount' in df.columns:
-        avg_transaction = df.groupby('Store_Type')['Sales_Amount'].mean().reset_index()
+        # Every panel is derived from one aggregation pass over Store_Type
+        aggregations = {'sales': ('Sales_Amount', 'sum'), 'avg': ('Sales_Amount', 'mean')}
+        if 'Manpower_Hours' in df.columns:
+            aggregations['hours'] = ('Manpower_Hours', 'sum')
+        if 'kWh_Used' in df.columns:
+            aggregations['kwh'] = ('kWh_Used', 'sum')
+        by_store = df.groupby('Store_Type', observed=True).agg(**aggregations)
+        store_types = by_store.index
+        
+        if 'hours' in by_store:
+            traces.append(go.Bar(x=store_types, y=by_store['sales'] / by_store['hours'],
+                                 marker_color='#10b981', name='$/Hour'))
+            cols.append(1)
         
-        fig.add_trace(
-            go.Bar(x=avg_transaction['Store_Type'], y=avg_transaction['Sales_Amount'],
-                   marker_color='#8b5cf6', name='Avg $'),
-            row=1, col=3
-        )
+        if 'kwh' in by_store:
+            traces.append(go.Bar(x=store_types, y=by_store['sales'] / by_store['kwh'],
+                                 marker_color='#06b6d4', name='$/kWh'))
+            cols.append(2)
+        
+        traces.append(go.Bar(x=store_types, y=by_store['avg'],
+                             marker_color='#8b5cf6', name='Avg $'))
+        cols.append(3)
+    
+    if traces:
+        fig.add_traces(traces, rows=1, cols=cols)
     
     fig.update_layout(
+        # Separate panels, since $/hour, $/kWh and $/transaction differ in unit and scale
         title_text='Operational Efficiency by Store Type',
         showlegend=False,
-        template='plotly_white',
         height=400
     )
     
@@ -195,7 +209,8 @@ def create_promotion_impact(df: pd.DataFrame) -> go.Figure:
     if 'Promotion_Flag' not in df.columns or 'Sales_Amount' not in df.columns:
         return None
     
-    promo_sales = df.groupby('Promotion_Flag')['Sales_Amount'].agg(['sum', 'mean', 'count']).reset_index()
+    promo_sales = df.groupby('Promotion_Flag', observed=True)['Sales_Amount'].agg(['sum', 'mean'])
+    flags = promo_sales.index.astype(str)
     
     fig = make_subplots(
         rows=1, cols=2,
@@ -203,26 +218,22 @@ def create_promotion_impact(df: pd.DataFrame) -> go.Figure:
         specs=[[{'type': 'bar'}, {'type': 'bar'}]]
     )
     
-    fig.add_trace(
-        go.Bar(x=promo_sales['Promotion_Flag'], y=promo_sales['sum'],
-               marker_color=['#ef4444', '#10b981'], name='Total Sales',
-               text=promo_sales['sum'].apply(lambda x: f'${x:,.0f}'),
+    fig.add_traces([
+        go.Bar(x=promo_sales.index, y=promo_sales['sum'],
+               marker_color=[PROMOTION_TOTAL_COLORS.get(flag, OTHER_FLAG_COLOR) for flag in flags],
+               name='Total Sales',
+               texttemplate='$%{y:,.0f}',
                textposition='auto'),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(x=promo_sales['Promotion_Flag'], y=promo_sales['mean'],
-               marker_color=['#f59e0b', '#06b6d4'], name='Avg Transaction',
-               text=promo_sales['mean'].apply(lambda x: f'${x:.2f}'),
-               textposition='auto'),
-        row=1, col=2
-    )
+        go.Bar(x=promo_sales.index, y=promo_sales['mean'],
+               marker_color=[PROMOTION_AVERAGE_COLORS.get(flag, OTHER_FLAG_COLOR) for flag in flags],
+               name='Avg Transaction',
+               texttemplate='$%{y:.2f}',
+               textposition='auto')
+    ], rows=1, cols=[1, 2])
     
     fig.update_layout(
         title_text='Promotion Impact Analysis',
         showlegend=False,
-        template='plotly_white',
         height=400
     )
     
@@ -234,20 +245,28 @@ def create_top_products(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     if 'Product_Name' not in df.columns or 'Sales_Amount' not in df.columns:
         return None
     
-    top_products = df.groupby('Product_Name')['Sales_Amount'].sum().nlargest(top_n).reset_index()
-    top_products = top_products.sort_values('Sales_Amount', ascending=True)
+    product_sales = df.groupby('Product_Name', observed=True, sort=False)['Sales_Amount'].sum()
+    names = product_sales.index.to_numpy()
+    sales = product_sales.to_numpy()
+    
+    # O(n) selection of the top products; only those few are sorted (ascending,
+    # so the largest bar ends up on top)
+    top = np.arange(len(sales))
+    if top_n < len(sales):
+        top = np.argpartition(sales, -top_n)[-top_n:]
+    order = top[np.argsort(sales[top], kind='stable')]
     
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        y=top_products['Product_Name'],
-        x=top_products['Sales_Amount'],
+        y=names[order],
+        x=sales[order],
         orientation='h',
         marker=dict(
-            color=top_products['Sales_Amount'],
+            color=sales[order],
             colorscale='Blues',
             showscale=False
         ),
-        text=top_products['Sales_Amount'].apply(lambda x: f'${x:,.0f}'),
+        texttemplate='$%{x:,.0f}',
         textposition='auto'
     ))
     
@@ -255,8 +274,98 @@ def create_top_products(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
         title=f'Top {top_n} Products by Revenue',
         xaxis_title='Total Revenue ($)',
         yaxis_title='Product',
-        template='plotly_white',
         height=500
     )
     
     return fig
+
+
+def _combine_in_row(figs: list, specs: list, column_widths: list, title: str, height: int) -> go.Figure:
+    """
+    Copy finished dashboard figures into one row of subplots.
+    
+    Args:
+        figs: (figure, number of subplot columns it uses) pairs, left to right
+        specs: Subplot spec for every column of the combined row
+        column_widths: Relative width of every column
+        title: Title of the combined figure
+        height: Figure height in pixels
+    
+    Returns:
+        Combined Plotly figure
+    """
+    subplot_titles, traces, cols, axis_titles = [], [], [], []
+    start = 1
+    for fig, span in figs:
+        if span == 1:
+            subplot_titles.append(fig.layout.title.text)
+        else:
+            subplot_titles.extend(annotation.text for annotation in fig.layout.annotations)
+        
+        for trace in fig.data:
+            # Traces of multi-column figures keep their relative column (x, x2, ...)
+            axis = trace.xaxis if 'xaxis' in trace else None
+            traces.append(trace)
+            cols.append(start + (int(axis[1:] or 1) - 1 if axis else 0))
+        
+        for offset in range(span):
+            suffix = str(offset + 1) if offset else ''
+            axis_titles.append((start + offset,
+                                fig.layout['xaxis' + suffix].title.text,
+                                fig.layout['yaxis' + suffix].title.text))
+        start += span
+    
+    combined = make_subplots(
+        rows=1, cols=start - 1,
+        specs=[specs],
+        column_widths=column_widths,
+        subplot_titles=subplot_titles
+    )
+    combined.add_traces(traces, rows=1, cols=cols)
+    
+    for col, x_title, y_title in axis_titles:
+        combined.update_xaxes(title_text=x_title, row=1, col=col)
+        combined.update_yaxes(title_text=y_title, row=1, col=col)
+    
+    combined.update_layout(
+        title_text=title,
+        showlegend=False,
+        height=height
+    )
+    
+    return combined
+
+
+def create_regional_product_overview(df: pd.DataFrame) -> go.Figure:
+    """Regional performance and product mix side by side in one figure."""
+    regional = create_regional_performance(df)
+    product_mix = create_product_mix(df)
+    if regional is None or product_mix is None:
+        return regional or product_mix
+    
+    fig = _combine_in_row(
+        [(regional, 1), (product_mix, 1)],
+        specs=[{'type': 'xy'}, {'type': 'domain'}],
+        column_widths=[0.55, 0.45],
+        title='Regional Performance & Product Mix',
+        height=450
+    )
+    # The regional colour scale would sit on top of the pie chart
+    fig.update_traces(marker_showscale=False, selector=dict(type='bar'))
+    return fig
+
+
+def create_promotion_and_top_products(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
+    """Promotion impact and top products side by side in one figure."""
+    promotion = create_promotion_impact(df)
+    top_products = create_top_products(df, top_n=top_n)
+    if promotion is None or top_products is None:
+        return promotion or top_products
+    
+    return _combine_in_row(
+        [(promotion, 2), (top_products, 1)],
+        specs=[{'type': 'xy'}, {'type': 'xy'}, {'type': 'xy'}],
+        column_widths=[0.25, 0.25, 0.5],
+        title='Promotion Impact & Top Products',
+        height=500
+    )
@@ -5,7 +5,13 @@ Handles month-over-month data comparison
 
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from . import figure_utils  # noqa: F401  (registers the default 'flowviz' template)
+from ._backend import fast_sum
+
+# Bar colours for the previous and current month, shared by the comparison charts
+PERIOD_COLORS = ['#764ba2', '#667eea']
 
 
 def calculate_comparison_summary(current_df: pd.DataFrame, previous_df: pd.DataFrame) -> tuple[list, pd.DataFrame]:
@@ -19,112 +25,102 @@ def calculate_comparison_summary(current_df: pd.DataFrame, previous_df: pd.DataF
     Returns:
         Tuple of (common_numeric_columns, summary_dataframe)
     """
-    # Find common numeric columns
-    current_numeric = set(current_df.select_dtypes(include=[np.number]).columns)
-    previous_numeric = set(previous_df.select_dtypes(include=[np.number]).columns)
-    common_numeric = list(current_numeric.intersection(previous_numeric))
+    # Find common numeric columns, kept in the current file's column order
+    current_numeric = current_df.select_dtypes(include=[np.number]).columns
+    previous_numeric = previous_df.select_dtypes(include=[np.number]).columns
+    common_numeric = current_numeric.intersection(previous_numeric, sort=False).tolist()
     
     if not common_numeric:
         return [], pd.DataFrame()
     
-    # Create summary dataframe
+    # Create summary dataframe from one reduction per DataFrame
+    previous_sums = fast_sum(previous_df, common_numeric)
+    current_sums = fast_sum(current_df, common_numeric)
     summary = pd.DataFrame({
         'Metric': common_numeric,
-        'Previous Month': [previous_df[col].sum() for col in common_numeric],
-        'Current Month': [current_df[col].sum() for col in common_numeric],
+        'Previous Month': previous_sums,
+        'Current Month': current_sums,
     })
-    summary['Change (%)'] = (
-        (summary['Current Month'] - summary['Previous Month']) / 
-        summary['Previous Month'] * 100
-    ).round(2)
+    # 0 where the previous total is 0, as in calculate_comparison_metrics
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary['Change (%)'] = np.where(
+            previous_sums != 0,
+            (current_sums - previous_sums) / previous_sums * 100,
+            0
+        ).round(2)
     
     return common_numeric, summary
 
 
-def calculate_overall_change(current_df: pd.DataFrame, previous_df: pd.DataFrame, common_numeric: list) -> float:
-    """
-    Calculate overall percentage change across all metrics.
-    
-    Args:
-        current_df: Current month DataFrame
-        previous_df: Previous month DataFrame
-        common_numeric: List of common numeric columns
-        
-    Returns:
-        Overall change percentage
-    """
-    current_total = current_df[common_numeric].sum().sum()
-    previous_total = previous_df[common_numeric].sum().sum()
-    
-    if previous_total != 0:
-        return ((current_total - previous_total) / previous_total * 100)
-    return 0
-
-
-def calculate_average_difference(current_df: pd.DataFrame, previous_df: pd.DataFrame, common_numeric: list) -> float:
+def create_comparison_overview(columns: list, previous_totals: pd.Series, current_totals: pd.Series) -> go.Figure:
     """
-    Calculate average difference across all metrics.
+    Create one figure with a month-over-month bar chart per metric, stacked vertically.
     
     Args:
-        current_df: Current month DataFrame
-        previous_df: Previous month DataFrame
-        common_numeric: List of common numeric columns
+        columns: Metrics to chart, top to bottom
+        previous_totals: Previous month sums indexed by column name
+        current_totals: Current month sums indexed by column name
         
     Returns:
-        Average difference value
+        Plotly figure with one subplot per metric
     """
-    avg_change = (
-        current_df[common_numeric].mean().mean() - 
-        previous_df[common_numeric].mean().mean()
+    fig = make_subplots(
+        rows=len(columns), cols=1,
+        subplot_titles=[f'{column} - Month over Month' for column in columns],
+        vertical_spacing=0.3 / max(len(columns), 1)
     )
-    return avg_change
-
-
-def create_comparison_chart(current_df: pd.DataFrame, previous_df: pd.DataFrame, column: str):
-    """
-    Create a comparison bar chart for a specific column.
-    
-    Args:
-        current_df: Current month DataFrame
-        previous_df: Previous month DataFrame
-        column: Column name to compare
-        
-    Returns:
-        Plotly figure object
-    """
-    comparison_data = pd.DataFrame({
-        'Period': ['Previous Month', 'Current Month'],
-        column: [previous_df[column].sum(), current_df[column].sum()]
-    })
-    
-    fig = px.bar(
-        comparison_data,
-        x='Period',
-        y=column,
-        title=f'{column} - Month over Month',
-        template='plotly_white',
-        color='Period',
-        color_discrete_sequence=['#764ba2', '#667eea']
+    # Traces are added in one call rather than one add_trace per subplot
+    fig.add_traces(
+        [
+            go.Bar(
+                x=['Previous Month', 'Current Month'],
+                y=[previous_totals[column], current_totals[column]],
+                marker_color=PERIOD_COLORS,
+                name=column,
+                showlegend=False
+            )
+            for column in columns
+        ],
+        rows=list(range(1, len(columns) + 1)),
+        cols=[1] * len(columns)
     )
-    
+    fig.update_layout(height=300 * len(columns), title='Month-over-Month Comparison')
     return fig
 
 
-def calculate_metric_change(current_df: pd.DataFrame, previous_df: pd.DataFrame, column: str) -> float:
+def calculate_comparison_metrics(current_df: pd.DataFrame, previous_df: pd.DataFrame, common_numeric: list) -> dict:
     """
-    Calculate percentage change for a specific metric.
+    Calculate the overall change, average difference and per-metric changes together.
+    
+    Each DataFrame is aggregated once. Percentage changes are 0 where the
+    previous total is 0, and the average difference compares the mean of
+    the per-column means.
     
     Args:
         current_df: Current month DataFrame
         previous_df: Previous month DataFrame
-        column: Column name to calculate change for
+        common_numeric: List of common numeric columns
         
     Returns:
-        Percentage change
+        Dictionary with overall_change, average_difference, metric_changes
+        and the per-column current_totals/previous_totals
     """
-    current_sum = current_df[column].sum()
-    previous_sum = previous_df[column].sum()
+    current = current_df[common_numeric].agg(['sum', 'mean'])
+    previous = previous_df[common_numeric].agg(['sum', 'mean'])
+    current_sums, previous_sums = current.loc['sum'], previous.loc['sum']
+    
+    previous_total = previous_sums.sum()
+    overall_change = 0
+    if previous_total != 0:
+        overall_change = (current_sums.sum() - previous_total) / previous_total * 100
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes = (current_sums - previous_sums) / previous_sums * 100
     
-    if previous_sum != 0:
-        return ((current_sum - previous_sum) / previous_sum * 100)
-    return 0
+    return {
+        'overall_change': overall_change,
+        'average_difference': current.loc['mean'].mean() - previous.loc['mean'].mean(),
+        'metric_changes': changes.where(previous_sums != 0, 0),
+        'current_totals': current_sums,
+        'previous_totals': previous_sums
+    }
@@ -5,7 +5,23 @@ Allows users to create custom visualizations by selecting columns and chart type
 
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+from .figure_utils import BUILDER_WEBGL_THRESHOLD, downsample_xy, scatter_trace_class
+from .datetime_utils import DETECTION_SAMPLE_SIZE, detect_datetime_format
+from .ml_analysis import fast_corr, partition_columns
+
+# Box plots of more rows than this are drawn from precomputed statistics
+BOX_PRECOMPUTE_THRESHOLD = 5000
+
+
+def _is_date_column(series: pd.Series) -> bool:
+    """Whether a datetime, text or categorical column holds dates, judged from a sample."""
+    # infer_dtype classifies the sample in C; only string-like values need the format sniffer
+    kind = pd.api.types.infer_dtype(series.head(DETECTION_SAMPLE_SIZE), skipna=True)
+    if kind in ('datetime64', 'datetime', 'date'):
+        return True
+    if kind not in ('string', 'categorical', 'empty'):
+        return False
+    return detect_datetime_format(series) is not None
 
 
 def get_column_types(df: pd.DataFrame) -> dict:
@@ -18,17 +34,12 @@ def get_column_types(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with categorized columns
     """
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-    
-    # Try to detect date columns
-    date_cols = []
-    for col in categorical_cols:
-        try:
-            pd.to_datetime(df[col], errors='raise')
-            date_cols.append(col)
-        except:
-            pass
+    columns = partition_columns(df)
+    numeric_cols = columns['numeric']
+    categorical_cols = columns['categorical']
+    
+    # Detect date columns from a regex-filtered sample rather than parsing every value
+    date_cols = [col for col in columns['datetime'] + categorical_cols if _is_date_column(df[col])]
     
     # Remove date columns from categorical
     categorical_cols = [col for col in categorical_cols if col not in date_cols]
@@ -42,21 +53,24 @@ def get_column_types(df: pd.DataFrame) -> dict:
 
 def create_custom_line_chart(df: pd.DataFrame, x_col: str, y_cols: list, title: str = None) -> go.Figure:
     """Create custom line chart."""
-    fig = go.Figure()
+    # Each series is reduced to its visual shape before it becomes a trace
+    series = [(y_col, *downsample_xy(df[x_col], df[y_col])) for y_col in y_cols]
     
-    for y_col in y_cols:
-        fig.add_trace(go.Scatter(
-            x=df[x_col],
-            y=df[y_col],
+    # Traces are built first and handed to the figure in one call
+    fig = go.Figure([
+        scatter_trace_class(len(y))(
+            x=x,
+            y=y,
             mode='lines+markers',
             name=y_col
-        ))
+        )
+        for y_col, x, y in series
+    ])
     
     fig.update_layout(
         title=title or f'{", ".join(y_cols)} over {x_col}',
         xaxis_title=x_col,
         yaxis_title='Values',
-        template='plotly_white',
         hovermode='x unified'
     )
     
@@ -66,32 +80,33 @@ def create_custom_line_chart(df: pd.DataFrame, x_col: str, y_cols: list, title:
 def create_custom_bar_chart(df: pd.DataFrame, x_col: str, y_col: str, 
                             orientation: str = 'v', title: str = None) -> go.Figure:
     """Create custom bar chart."""
-    # Aggregate if needed
-    if df[x_col].dtype == 'object' or df[x_col].dtype.name == 'category':
-        grouped = df.groupby(x_col)[y_col].sum().reset_index()
+    x = df[x_col]
+    if x.dtype != 'object' and x.dtype.name != 'category' and x.is_unique:
+        # One row per x value (e.g. a numeric ID or date); nothing to aggregate
+        grouped = pd.Series(df[y_col].to_numpy(), index=x)
     else:
-        grouped = df[[x_col, y_col]]
+        # Horizontal bars are re-ordered by value, so their keys are not sorted
+        grouped = df[y_col].groupby(x, observed=True, sort=orientation != 'h').sum()
     
     if orientation == 'h':
-        grouped = grouped.sort_values(y_col, ascending=True)
+        grouped = grouped.sort_values()
         fig = go.Figure(go.Bar(
-            y=grouped[x_col],
-            x=grouped[y_col],
+            y=grouped.index,
+            x=grouped.to_numpy(),
             orientation='h',
             marker_color='#10b981'
         ))
     else:
         fig = go.Figure(go.Bar(
-            x=grouped[x_col],
-            y=grouped[y_col],
+            x=grouped.index,
+            y=grouped.to_numpy(),
             marker_color='#06b6d4'
         ))
     
     fig.update_layout(
         title=title or f'{y_col} by {x_col}',
         xaxis_title=x_col if orientation == 'v' else y_col,
-        yaxis_title=y_col if orientation == 'v' else x_col,
-        template='plotly_white'
+        yaxis_title=y_col if orientation == 'v' else x_col
     )
     
     return fig
@@ -102,14 +117,15 @@ def create_custom_scatter(df: pd.DataFrame, x_col: str, y_col: str,
                          title: str = None) -> go.Figure:
     """Create custom scatter plot."""
     if color_col:
+        import plotly.express as px
         fig = px.scatter(
             df, x=x_col, y=y_col, color=color_col,
             size=size_col if size_col else None,
             title=title or f'{y_col} vs {x_col}',
-            template='plotly_white'
+            render_mode='webgl' if len(df) > BUILDER_WEBGL_THRESHOLD else 'svg'
         )
     else:
-        fig = go.Figure(go.Scatter(
+        fig = go.Figure(scatter_trace_class(len(df))(
             x=df[x_col],
             y=df[y_col],
             mode='markers',
@@ -122,8 +138,7 @@ def create_custom_scatter(df: pd.DataFrame, x_col: str, y_col: str,
         fig.update_layout(
             title=title or f'{y_col} vs {x_col}',
             xaxis_title=x_col,
-            yaxis_title=y_col,
-            template='plotly_white'
+            yaxis_title=y_col
         )
     
     return fig
@@ -132,7 +147,7 @@ def create_custom_scatter(df: pd.DataFrame, x_col: str, y_col: str,
 def create_custom_pie_chart(df: pd.DataFrame, names_col: str, values_col: str, 
                             title: str = None) -> go.Figure:
     """Create custom pie chart."""
-    grouped = df.groupby(names_col)[values_col].sum().reset_index()
+    grouped = df.groupby(names_col, observed=True)[values_col].sum().reset_index()
     
     fig = go.Figure(go.Pie(
         labels=grouped[names_col],
@@ -142,38 +157,94 @@ def create_custom_pie_chart(df: pd.DataFrame, names_col: str, values_col: str,
     ))
     
     fig.update_layout(
-        title=title or f'{values_col} by {names_col}',
-        template='plotly_white'
+        title=title or f'{values_col} by {names_col}'
     )
     
     return fig
 
 
+def _box_statistics(df: pd.DataFrame, category_col: str, value_col: str) -> tuple:
+    """
+    Tukey box statistics per category, computed the way plotly.js would.
+    
+    Returns:
+        Tuple of (stats DataFrame indexed by category with q1, median, q3,
+        lowerfence and upperfence columns, outlier categories, outlier values)
+    """
+    # Categories keep their order of first appearance, as plotly gives the raw-data box plot
+    categories = df[category_col].astype(str)
+    order = categories.unique()
+    has_value = df[value_col].notna()
+    categories = categories[has_value]
+    values = df[value_col][has_value]
+    groups = values.groupby(categories, sort=False)
+    
+    # Linear interpolation matches plotly's default quartilemethod
+    stats = groups.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    stats = stats.reindex([category for category in order if category in stats.index])
+    iqr = stats['q3'] - stats['q1']
+    low_limit = categories.map(stats['q1'] - 1.5 * iqr)
+    high_limit = categories.map(stats['q3'] + 1.5 * iqr)
+    
+    # Whiskers end at the most extreme values inside 1.5 IQR of the box
+    stats['lowerfence'] = values.where(values >= low_limit).groupby(categories).min()
+    stats['upperfence'] = values.where(values <= high_limit).groupby(categories).max()
+    
+    outliers = (values < low_limit) | (values > high_limit)
+    return stats, categories[outliers], values[outliers]
+
+
 def create_custom_box_plot(df: pd.DataFrame, category_col: str, value_col: str,
                            title: str = None) -> go.Figure:
     """Create custom box plot."""
-    fig = go.Figure()
-    
-    for category in df[category_col].unique():
-        data = df[df[category_col] == category][value_col]
-        fig.add_trace(go.Box(
-            y=data,
-            name=str(category)
+    if len(df) <= BOX_PRECOMPUTE_THRESHOLD:
+        # One trace with a categorical x axis draws a box per category without
+        # masking the frame once per category
+        fig = go.Figure(go.Box(
+            x=df[category_col].astype(str),
+            y=df[value_col],
+            marker_color='#8b5cf6'
         ))
+    else:
+        # Large data: send the box statistics and outliers, not every value
+        stats, outlier_x, outlier_y = _box_statistics(df, category_col, value_col)
+        fig = go.Figure([
+            go.Box(
+                x=stats.index,
+                q1=stats['q1'],
+                median=stats['median'],
+                q3=stats['q3'],
+                lowerfence=stats['lowerfence'],
+                upperfence=stats['upperfence'],
+                marker_color='#8b5cf6'
+            ),
+            scatter_trace_class(len(outlier_y))(
+                x=outlier_x,
+                y=outlier_y,
+                mode='markers',
+                marker_color='#8b5cf6',
+                showlegend=False
+            )
+        ])
     
     fig.update_layout(
         title=title or f'{value_col} distribution by {category_col}',
         yaxis_title=value_col,
         xaxis_title=category_col,
-        template='plotly_white'
+        showlegend=False
     )
     
     return fig
 
 
-def create_custom_heatmap(df: pd.DataFrame, columns: list, title: str = None) -> go.Figure:
-    """Create custom correlation heatmap."""
-    corr_matrix = df[columns].corr()
+def create_custom_heatmap(df: pd.DataFrame, columns: list, title: str = None,
+                          corr_matrix: pd.DataFrame = None) -> go.Figure:
+    """Create custom correlation heatmap, slicing corr_matrix when a precomputed one is given."""
+    if corr_matrix is not None:
+        corr_matrix = corr_matrix.loc[columns, columns]
+    else:
+        corr_matrix = fast_corr(df, columns)
     
     fig = go.Figure(go.Heatmap(
         z=corr_matrix.values,
@@ -189,7 +260,6 @@ def create_custom_heatmap(df: pd.DataFrame, columns: list, title: str = None) ->
     
     fig.update_layout(
         title=title or 'Correlation Heatmap',
-        template='plotly_white',
         xaxis=dict(side='bottom')
     )
     
@@ -199,23 +269,22 @@ def create_custom_heatmap(df: pd.DataFrame, columns: list, title: str = None) ->
 def create_custom_area_chart(df: pd.DataFrame, x_col: str, y_cols: list, 
                              title: str = None) -> go.Figure:
     """Create custom area chart."""
-    fig = go.Figure()
-    
-    for y_col in y_cols:
-        fig.add_trace(go.Scatter(
+    fig = go.Figure([
+        go.Scatter(
             x=df[x_col],
             y=df[y_col],
             mode='lines',
             name=y_col,
-            fill='tonexty' if len(fig.data) > 0 else 'tozeroy',
+            fill='tonexty' if i > 0 else 'tozeroy',
             stackgroup='one'
-        ))
+        )
+        for i, y_col in enumerate(y_cols)
+    ])
     
     fig.update_layout(
         title=title or f'Stacked Area: {", ".join(y_cols)}',
         xaxis_title=x_col,
         yaxis_title='Values',
-        template='plotly_white',
         hovermode='x unified'
     )
     
@@ -234,8 +303,7 @@ def create_custom_histogram(df: pd.DataFrame, column: str, bins: int = 30,
     fig.update_layout(
         title=title or f'Distribution of {column}',
         xaxis_title=column,
-        yaxis_title='Frequency',
-        template='plotly_white'
+        yaxis_title='Frequency'
     )
     
     return fig
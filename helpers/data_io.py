@@ -0,0 +1,277 @@
+"""
+Data input/output functions for FlowViz
+Reads uploaded and sample files into DataFrames and serializes them for download
+"""
+
+import io
+import os
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from .datetime_utils import detect_datetime_format
+
+# Repeated labels in the bundled sample datasets
+SAMPLE_CATEGORICAL_COLUMNS = ['Region', 'Store_Type', 'Product_Category', 'Product_Name', 'Promotion_Flag', 'Shift']
+
+# Rows inspected when inferring dtypes for an uploaded CSV
+SNIFF_ROWS = 1000
+
+# Bump whenever optimize_dtypes or the sample dtypes change, to invalidate
+# the Feather caches written next to the sample CSVs
+SAMPLE_CACHE_VERSION = 3
+
+
+def infer_categorical_dtypes(sample: pd.DataFrame, max_unique_ratio: float = 0.5) -> dict:
+    """
+    Pick the string columns of a sample that are worth storing as categoricals.
+    
+    Only columns whose values are all strings qualify: a categorical with
+    mixed-type categories (e.g. an Excel ID column holding 101 and 'A-7')
+    cannot be converted to Arrow, which Streamlit needs to display it.
+    Date-shaped columns are left as strings so the date detection and
+    parsing used by the charts still see them.
+    
+    Args:
+        sample: Leading rows of the file
+        max_unique_ratio: Maximum share of distinct values for a column to qualify
+        
+    Returns:
+        Dtype mapping suitable for pd.read_csv
+    """
+    if sample.empty:
+        return {}
+    
+    object_cols = [col for col in sample.select_dtypes(include=['object']).columns
+                   if pd.api.types.infer_dtype(sample[col], skipna=True) == 'string']
+    unique_counts = sample[object_cols].nunique()
+    low_card = unique_counts[unique_counts / len(sample) < max_unique_ratio].index
+    return {col: 'category' for col in low_card if detect_datetime_format(sample[col]) is None}
+
+
+def optimize_dtypes(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Shrink a freshly loaded DataFrame to compact dtypes.
+    
+    All-null columns are dropped. 64-bit integers become int32 when their
+    range allows; integers are not cast to float so IDs and counts stay
+    exact. Floats stay float64: currency and measurement columns feed the
+    displayed totals and means, and float32 values (about 7 significant
+    digits) would show rounding noise there. Repetitive string columns
+    become categoricals.
+    High-cardinality strings are kept, since names, IDs and dates are used
+    by the charts.
+    
+    Args:
+        df: DataFrame to shrink, modified in place
+        max_unique_ratio: Maximum share of distinct values for a string column to become categorical
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    # Entirely empty columns (e.g. trailing blank columns in spreadsheets)
+    # carry nothing to analyze
+    empty_cols = df.columns[df.isna().all()]
+    if len(empty_cols):
+        df.drop(columns=empty_cols, inplace=True)
+    
+    # int32 rather than the narrowest type, so element-wise products of
+    # counts do not overflow
+    int32 = np.iinfo(np.int32)
+    for col in df.select_dtypes(include=['int64']).columns:
+        if len(df) and int32.min <= df[col].min() and df[col].max() <= int32.max:
+            df[col] = df[col].astype('int32')
+    
+    for col, dtype in infer_categorical_dtypes(df, max_unique_ratio).items():
+        df[col] = df[col].astype(dtype)
+    
+    return df
+
+
+def _read_csv(source, dtype: dict | None = None) -> pd.DataFrame:
+    """
+    Read a CSV with Arrow's multithreaded parser, falling back to the C engine.
+    
+    Columns mapped to 'category' are dictionary-encoded while parsing, so
+    they arrive as pandas categoricals without first being materialized as
+    Python string objects. Their categories are sorted afterwards, as
+    pd.read_csv(dtype='category') would give, because Arrow keeps them in
+    order of first appearance and the charts group and colour by that order.
+    """
+    dtype = dtype or {}
+    dictionary_type = pa.dictionary(pa.int32(), pa.string())
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: dictionary_type for col, kind in dtype.items() if kind == 'category'}
+    )
+    try:
+        df = pacsv.read_csv(source, convert_options=convert_options).to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_csv(source, dtype=dtype)
+    
+    for col in convert_options.column_types:
+        if col in df.columns:
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+    return df
+
+
+def dataframe_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Hash a DataFrame's contents into a short key for per-dataset caches.
+    
+    Args:
+        df: DataFrame to fingerprint
+        
+    Returns:
+        Hex digest that changes whenever the values or columns change
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    digest = hashlib.md5(row_hashes.tobytes())
+    digest.update('\x1f'.join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def _read_excel(source) -> pd.DataFrame:
+    """Read a workbook with the Rust calamine engine, or openpyxl if python-calamine is missing."""
+    try:
+        return pd.read_excel(source, engine='calamine')
+    except ImportError:
+        source.seek(0)
+        return pd.read_excel(source)
+
+
+def read_uploaded_file(data: bytes, file_name: str) -> pd.DataFrame:
+    """
+    Parse the raw bytes of an uploaded CSV or Excel file.
+    
+    Args:
+        data: File contents
+        file_name: Original file name, used to pick the reader
+    
+    Returns:
+        Parsed DataFrame with compact dtypes
+    """
+    if file_name.lower().endswith('.csv'):
+        sample = pd.read_csv(io.BytesIO(data), nrows=SNIFF_ROWS)
+        return optimize_dtypes(_read_csv(io.BytesIO(data), infer_categorical_dtypes(sample)))
+    return optimize_dtypes(_read_excel(io.BytesIO(data)))
+
+
+def read_sample_csv(path: str) -> pd.DataFrame:
+    """
+    Read one of the bundled sample datasets.
+    
+    The parsed frame is stored in a Feather file next to the CSV and read
+    back from there while it is newer than the CSV, skipping CSV parsing.
+    The file name carries SAMPLE_CACHE_VERSION, so caches written by an
+    older optimize_dtypes are not reused.
+    
+    Args:
+        path: Path to the sample CSV file
+    
+    Returns:
+        Parsed DataFrame with compact dtypes
+    """
+    feather_path = f'{os.path.splitext(path)[0]}.v{SAMPLE_CACHE_VERSION}.feather'
+    if os.path.exists(feather_path) and os.path.getmtime(feather_path) >= os.path.getmtime(path):
+        return pd.read_feather(feather_path)
+    
+    df = optimize_dtypes(_read_csv(path, {col: 'category' for col in SAMPLE_CATEGORICAL_COLUMNS}))
+    tmp_path = None
+    try:
+        # Written to a temporary file and renamed into place, so a concurrent
+        # reader never sees a half-written cache
+        fd, tmp_path = tempfile.mkstemp(suffix='.feather.tmp', dir=os.path.dirname(feather_path) or '.')
+        with os.fdopen(fd, 'wb') as tmp:
+            df.to_feather(tmp)
+        os.replace(tmp_path, feather_path)
+    except OSError:
+        # Read-only deployments just parse the CSV each time
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to CSV for download.
+    
+    Arrow's C writer streams rows straight into a byte buffer, avoiding the
+    intermediate Python string that df.to_csv builds before encoding.
+    
+    Args:
+        df: DataFrame to export
+        
+    Returns:
+        UTF-8 encoded CSV contents
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns (common in Excel uploads) have no Arrow type
+        return df.to_csv(index=False).encode('utf-8')
+    
+    output = io.BytesIO()
+    pacsv.write_csv(table, output)
+    return output.getvalue()
+
+
+def to_excel_bytes(df: pd.DataFrame, sheet_name: str = 'Data') -> bytes:
+    """
+    Serialize a DataFrame to an .xlsx workbook.
+    
+    Args:
+        df: DataFrame to export
+        sheet_name: Worksheet name
+        
+    Returns:
+        Workbook contents
+    """
+    output = io.BytesIO()
+    # constant_memory is not usable here: pandas writes column by column, and
+    # that mode only keeps the row being written
+    options = {'strings_to_urls': False}
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
+        df.to_excel(writer, index=False, sheet_name=sheet_name)
+    return output.getvalue()
+
+
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with the object/category columns Arrow cannot type converted to strings (nulls kept)."""
+    mixed = []
+    for col in df.select_dtypes(include=['object', 'category']).columns:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            mixed.append(col)
+    return df.assign(**{
+        col: df[col].astype(object).where(df[col].isna(), df[col].astype(str)) for col in mixed
+    })
+
+
+def to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to a zstd-compressed Parquet file.
+    
+    Much smaller and faster to write than .xlsx, and column types
+    (including categoricals) survive the round trip.
+    
+    Args:
+        df: DataFrame to export
+        
+    Returns:
+        Parquet file contents
+    """
+    import pyarrow.parquet as pq
+    
+    output = io.BytesIO()
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns (common in Excel uploads) are written as text
+        table = pa.Table.from_pandas(_stringify_mixed_columns(df), preserve_index=False)
+    pq.write_table(table, output, compression='zstd')
+    return output.getvalue()
@@ -3,40 +3,67 @@ DateTime utility functions for FlowViz
 Handles date format detection and parsing
 """
 
+import re
 import pandas as pd
 
+# Values checked per column when detecting a datetime format
+DETECTION_SAMPLE_SIZE = 100
+
+# Every supported format starts with a numeric date part such as 2025-10 or 01/10
+_DATE_PREFIX = re.compile(r'\d{1,4}[-/.]\d{1,2}')
+
+# Explicit formats tried in order; ISO8601 is the catch-all tried last
+COMMON_FORMATS = [
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%d-%m-%Y',
+    '%d/%m/%Y',
+    '%m-%d-%Y',
+    '%m/%d/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%d-%m-%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+]
+
+# Regex for the text each format directive can match (a superset of strptime's)
+_DIRECTIVE_PATTERNS = {'%Y': r'\d{4}', '%m': r'\s?\d{1,2}', '%d': r'\s?\d{1,2}',
+                       '%H': r'\d{1,2}', '%M': r'\d{1,2}', '%S': r'\d{1,2}'}
+
+
+def _format_shape(fmt: str) -> re.Pattern:
+    """Compile a regex matching every string the strptime format could parse."""
+    parts = re.split(r'(%[YmdHMS])', fmt)
+    return re.compile(''.join(_DIRECTIVE_PATTERNS.get(part, re.escape(part)) for part in parts))
+
+
+_FORMAT_SHAPES = [(fmt, _format_shape(fmt)) for fmt in COMMON_FORMATS]
+
 
 def detect_datetime_format(series: pd.Series) -> str | None:
     """
     Try to infer a consistent datetime format for the series.
     
+    Only the first DETECTION_SAMPLE_SIZE non-null values are checked, and a
+    column whose sample is not all date-shaped is rejected before any
+    format is tried.
+    
     Args:
         series: Pandas Series containing potential datetime strings
         
     Returns:
         Detected datetime format string or None if no format detected
     """
-    cleaned = series.dropna().astype(str).str.strip()
-    if cleaned.empty:
+    sample = series.dropna().head(DETECTION_SAMPLE_SIZE).astype(str).str.strip()
+    if sample.empty or not sample.str.match(_DATE_PREFIX).all():
         return None
 
-    # Try common datetime formats
-    common_formats = [
-        '%Y-%m-%d',
-        '%Y/%m/%d',
-        '%d-%m-%Y',
-        '%d/%m/%Y',
-        '%m-%d-%Y',
-        '%m/%d/%Y',
-        '%Y-%m-%d %H:%M:%S',
-        '%Y/%m/%d %H:%M:%S',
-        '%d-%m-%Y %H:%M:%S',
-        '%d/%m/%Y %H:%M:%S',
-    ]
-    
-    sample = cleaned.head(50)
+    # Only formats whose shape fits the first value can parse the whole
+    # sample, so the others are skipped without raising a parse error
+    first = sample.iat[0]
+    candidates = [fmt for fmt, shape in _FORMAT_SHAPES if shape.fullmatch(first)]
     
-    for fmt in common_formats:
+    for fmt in candidates + ['ISO8601']:
         try:
             # Try to parse the sample with this format
             pd.to_datetime(sample, format=fmt, errors='raise')
@@ -0,0 +1,289 @@
+"""
+Figure post-processing utilities for FlowViz
+Keeps large Plotly figures light enough to ship to the browser
+"""
+
+import datetime
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+
+# Points kept per trace when downsampling
+DEFAULT_MAX_POINTS = 2500
+
+# Traces longer than this are drawn with WebGL instead of SVG
+WEBGL_POINT_THRESHOLD = 5000
+
+# Chart builders switch to WebGL above this many points (plotly express's own cut-off)
+BUILDER_WEBGL_THRESHOLD = 1000
+
+# Standalone chart page; plotly.js is loaded once from the CDN instead of being embedded
+_HTML_TEMPLATE = (
+    '<html>\n<head><meta charset="utf-8">'
+    '<script src="https://cdn.plot.ly/plotly-{version}.min.js"></script></head>\n'
+    '<body>\n{charts}</body>\n</html>\n'
+)
+_CHART_TEMPLATE = (
+    '<div id="chart-{index}" style="width:100%;height:{height};"></div>\n'
+    '<script>Plotly.newPlot("chart-{index}", {figure});</script>\n'
+)
+
+# Layout settings kept from plotly_white for the default chart template
+_TEMPLATE_LAYOUT_KEYS = (
+    'autotypenumbers', 'colorway', 'font', 'hovermode', 'hoverlabel', 'paper_bgcolor',
+    'plot_bgcolor', 'coloraxis', 'xaxis', 'yaxis', 'annotationdefaults', 'title'
+)
+
+# Per-point trace attributes that must be subset together with x/y
+_POINT_ATTRIBUTES = ('text', 'hovertext', 'customdata')
+_MARKER_ATTRIBUTES = ('size', 'color')
+
+
+def _build_template() -> go.layout.Template:
+    """
+    Trim plotly_white down to what the FlowViz charts use.
+    
+    A figure carries its template in its JSON, and plotly_white's defaults
+    for every trace type (3D, geo, tables, ...) are most of each chart's
+    payload; this keeps the look of the bar, pie, line and heatmap charts.
+    """
+    base = pio.templates['plotly_white']
+    layout = {key: base.layout[key] for key in _TEMPLATE_LAYOUT_KEYS}
+    layout['colorscale'] = {
+        'sequential': base.layout.colorscale.sequential,
+        'diverging': base.layout.colorscale.diverging
+    }
+    return go.layout.Template(
+        layout=layout,
+        data={
+            'bar': [go.Bar(marker_line=dict(color='white', width=0.5))],
+            'pie': [go.Pie(automargin=True)]
+        }
+    )
+
+
+# Registered on import, so every chart builder that imports this module
+# picks up the template without setting it per figure
+pio.templates['flowviz'] = _build_template()
+pio.templates.default = 'flowviz'
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+    
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket.
+    
+    Args:
+        x: Monotonic numeric x values
+        y: Numeric y values
+        n_out: Number of points to keep
+    
+    Returns:
+        Sorted indices of the selected points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) -
+            (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def _numeric_axis(values) -> np.ndarray | None:
+    """Map trace x values onto a monotonic float axis, or None if unsorted or not numeric/datetime."""
+    values = np.asarray(values)
+
+    if values.dtype.kind == 'M':
+        axis = values.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    elif values.dtype.kind in 'iufb':
+        axis = values.astype(np.float64)
+    elif len(values) and isinstance(values[0], (datetime.date, np.datetime64)):
+        axis = pd.to_datetime(values).asi8.astype(np.float64)
+    else:
+        # String or categorical labels carry no order to check, so row
+        # order may mix unrelated categories; leave those traces whole
+        return None
+
+    if np.any(np.diff(axis) < 0):
+        return None
+    return axis
+
+
+def downsample_xy(x, y, max_points: int = DEFAULT_MAX_POINTS) -> tuple:
+    """
+    Downsample one series with LTTB before it is turned into a trace.
+    
+    Args:
+        x: Sorted x values (numbers or dates)
+        y: Numeric y values
+        max_points: Maximum number of points to keep
+        
+    Returns:
+        Tuple of (x, y), unchanged if short enough, if x is unsorted or if
+        x holds labels rather than numbers or dates
+    """
+    if len(y) <= max_points:
+        return x, y
+    
+    axis = _numeric_axis(x)
+    if axis is None:
+        return x, y
+    
+    idx = lttb_indices(axis, y, max_points)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
+
+def _is_per_point(value, n: int) -> bool:
+    return value is not None and not isinstance(value, str) and np.ndim(value) == 1 and len(value) == n
+
+
+def downsample_figure(fig: go.Figure, n_out: int = DEFAULT_MAX_POINTS) -> go.Figure:
+    """
+    Reduce oversized scatter/line traces to n_out points in place.
+    
+    Traces with unsorted x values and stacked traces (which must keep a
+    shared x axis) are left untouched.
+    
+    Args:
+        fig: Plotly figure to downsample
+        n_out: Maximum number of points per trace
+    
+    Returns:
+        The same figure, for chaining
+    """
+    for trace in fig.data:
+        if trace.type not in ('scatter', 'scattergl') or getattr(trace, 'stackgroup', None):
+            continue
+        if trace.x is None or trace.y is None or len(trace.y) <= n_out:
+            continue
+
+        axis = _numeric_axis(trace.x)
+        if axis is None:
+            continue
+
+        n = len(trace.y)
+        idx = lttb_indices(axis, trace.y, n_out)
+
+        with fig.batch_update():
+            trace.x = np.asarray(trace.x)[idx]
+            trace.y = np.asarray(trace.y)[idx]
+            for attr in _POINT_ATTRIBUTES:
+                if _is_per_point(trace[attr], n):
+                    trace[attr] = np.asarray(trace[attr])[idx]
+            for attr in _MARKER_ATTRIBUTES:
+                if _is_per_point(trace.marker[attr], n):
+                    trace.marker[attr] = np.asarray(trace.marker[attr])[idx]
+
+    return fig
+
+
+def scatter_trace_class(n_points: int, threshold: int = BUILDER_WEBGL_THRESHOLD):
+    """
+    Pick the scatter trace type for a chart builder.
+    
+    Small plots stay SVG for crisp rendering; larger ones use WebGL.
+    
+    Args:
+        n_points: Number of points in the trace
+        threshold: Point count above which WebGL is used
+        
+    Returns:
+        go.Scattergl or go.Scatter
+    """
+    return go.Scattergl if n_points > threshold else go.Scatter
+
+
+def to_webgl(fig: go.Figure, threshold: int = WEBGL_POINT_THRESHOLD) -> go.Figure:
+    """
+    Swap large SVG scatter traces for WebGL (scattergl) traces.
+    
+    Stacked traces are kept as SVG since scattergl has no stackgroup
+    support. Properties scattergl does not understand are dropped.
+    
+    Args:
+        fig: Plotly figure to convert
+        threshold: Minimum number of points for a trace to be converted
+        
+    Returns:
+        A new figure if any trace was converted, otherwise fig itself
+    """
+    traces = []
+    converted = False
+    for trace in fig.data:
+        if (trace.type == 'scatter' and not trace.stackgroup
+                and trace.x is not None and len(trace.x) > threshold):
+            props = trace.to_plotly_json()
+            props.pop('type', None)
+            traces.append(go.Scattergl(props, skip_invalid=True))
+            converted = True
+        else:
+            traces.append(trace)
+    
+    if not converted:
+        return fig
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+def figures_to_html_bytes(figs: list[go.Figure]) -> bytes:
+    """
+    Render several figures into one standalone HTML page for download.
+    
+    Only the figure JSON is written; plotly.js is referenced once from the
+    CDN rather than embedding the ~3 MB bundle for every chart.
+    
+    Args:
+        figs: Plotly figures to export, stacked top to bottom
+        
+    Returns:
+        UTF-8 encoded HTML document
+    """
+    # A lone chart fills the window; stacked charts get a fixed height each
+    height = '100vh' if len(figs) == 1 else '500px'
+    # to_json escapes '<' and '/', so titles cannot close the script tag early
+    charts = ''.join(
+        _CHART_TEMPLATE.format(index=i, height=height, figure=fig.to_json())
+        for i, fig in enumerate(figs)
+    )
+    html = _HTML_TEMPLATE.format(version=get_plotlyjs_version(), charts=charts)
+    return html.encode('utf-8')
+
+
+def figure_to_html_bytes(fig: go.Figure) -> bytes:
+    """
+    Render a figure as a standalone HTML page for download.
+    
+    Args:
+        fig: Plotly figure to export
+        
+    Returns:
+        UTF-8 encoded HTML document
+    """
+    return figures_to_html_bytes([fig])
@@ -5,15 +5,43 @@ Analyzes data and recommends optimal visualizations
 
 import pandas as pd
 import numpy as np
-from .datetime_utils import detect_datetime_format, parse_datetime_column
+from ._backend import fast_var
+from .datetime_utils import detect_datetime_format
 
 
-def analyze_data_with_ml(df: pd.DataFrame) -> list[dict]:
+def partition_columns(df: pd.DataFrame) -> dict:
+    """
+    Split columns into numeric, categorical and datetime in one pass over the dtypes.
+    
+    Matches select_dtypes(include=[np.number]),
+    select_dtypes(include=['object', 'category']) and
+    select_dtypes(include=['datetime', 'datetimetz']) without building an
+    Index for each call.
+    
+    Args:
+        df: DataFrame to analyze
+        
+    Returns:
+        Dictionary with 'numeric', 'categorical' and 'datetime' column name lists
+    """
+    numeric, categorical, datetime = [], [], []
+    for col, dtype in df.dtypes.items():
+        if dtype.kind in 'iufcm':  # select_dtypes counts timedeltas as numbers too
+            numeric.append(col)
+        elif dtype == object or isinstance(dtype, pd.CategoricalDtype):
+            categorical.append(col)
+        elif dtype.kind == 'M':  # e.g. ISO timestamps typed by the Arrow CSV reader
+            datetime.append(col)
+    return {'numeric': numeric, 'categorical': categorical, 'datetime': datetime}
+
+
+def analyze_data_with_ml(df: pd.DataFrame, columns: dict | None = None) -> list[dict]:
     """
     Use ML to determine best visualizations for the data.
     
     Args:
         df: DataFrame to analyze
+        columns: Optional partition_columns(df) result, if already computed
         
     Returns:
         List of visualization recommendations sorted by priority
@@ -21,23 +49,19 @@ def analyze_data_with_ml(df: pd.DataFrame) -> list[dict]:
     recommendations = []
     
     # Separate numeric and categorical columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+    columns = columns or partition_columns(df)
+    numeric_cols = columns['numeric']
+    categorical_cols = columns['categorical']
     
-    # Date columns detection
-    date_cols = []
+    # Date columns detection; datetime64 columns need no parsing, and only a
+    # sample of each text or categorical column is parsed
+    date_cols = list(columns.get('datetime', []))
     date_formats = {}
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            fmt = detect_datetime_format(df[col])
-            if fmt:
-                parsed = parse_datetime_column(df, col, fmt)
-            else:
-                parsed = parse_datetime_column(df, col)
-
-            if parsed.notna().any():
-                date_cols.append(col)
-                date_formats[col] = fmt
+    for col in categorical_cols:
+        fmt = detect_datetime_format(df[col])
+        if fmt is not None:
+            date_cols.append(col)
+            date_formats[col] = fmt
     
     # Recommendation 1: Time series if date column exists
     if date_cols and numeric_cols:
@@ -62,7 +86,7 @@ def analyze_data_with_ml(df: pd.DataFrame) -> list[dict]:
     # Recommendation 3: Distribution plots for numeric columns
     if numeric_cols:
         # Use variance to identify most interesting columns
-        variances = df[numeric_cols].var().sort_values(ascending=False)
+        variances = fast_var(df, numeric_cols).sort_values(ascending=False)
         top_cols = variances.head(3).index.tolist()
         recommendations.append({
             'type': 'distribution',
@@ -71,25 +95,30 @@ def analyze_data_with_ml(df: pd.DataFrame) -> list[dict]:
             'priority': 3
         })
     
+    # Unique counts of every categorical column in one call
+    unique_counts = df[categorical_cols].nunique() if categorical_cols else pd.Series(dtype='int64')
+    
     # Recommendation 4: Category analysis
     if categorical_cols and numeric_cols:
-        # Find categorical column with reasonable number of unique values
-        for cat_col in categorical_cols:
-            if 2 <= df[cat_col].nunique() <= 20:
-                recommendations.append({
-                    'type': 'category_analysis',
-                    'category': cat_col,
-                    'values': numeric_cols[:2],
-                    'title': f'Analysis by {cat_col}',
-                    'priority': 4
-                })
-                break
+        # First categorical column with a reasonable number of unique values
+        eligible = unique_counts.index[(unique_counts >= 2) & (unique_counts <= 20)]
+        if len(eligible):
+            cat_col = eligible[0]
+            recommendations.append({
+                'type': 'category_analysis',
+                'category': cat_col,
+                'values': numeric_cols[:2],
+                'title': f'Analysis by {cat_col}',
+                'priority': 4
+            })
     
     # Recommendation 5: Top N analysis
     if categorical_cols and numeric_cols:
+        # Prefer a column that actually varies for the bar labels
+        varying = unique_counts.index[unique_counts > 1]
         recommendations.append({
             'type': 'top_n',
-            'category': categorical_cols[0],
+            'category': varying[0] if len(varying) else categorical_cols[0],
             'value': numeric_cols[0],
             'title': f'Top 10 by {numeric_cols[0]}',
             'priority': 5
@@ -108,12 +137,43 @@ def get_data_statistics(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary containing statistics
     """
-    numeric_cols = len(df.select_dtypes(include=[np.number]).columns)
-    categorical_cols = len(df.select_dtypes(include=['object']).columns)
+    columns = partition_columns(df)
+    total_rows, total_columns = df.shape
     
     return {
-        'total_rows': df.shape[0],
-        'total_columns': df.shape[1],
-        'numeric_columns': numeric_cols,
-        'categorical_columns': categorical_cols
+        'total_rows': total_rows,
+        'total_columns': total_columns,
+        'numeric_columns': len(columns['numeric']),
+        'categorical_columns': len(columns['categorical'])
     }
+
+
+def fast_corr(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """
+    Pearson correlation matrix computed with a single matrix product.
+    
+    Centered columns are multiplied in one BLAS call instead of pandas
+    correlating each column pair. Columns with missing values need
+    pairwise-complete handling, so those frames go through df.corr().
+    
+    Args:
+        df: DataFrame containing the columns
+        columns: Numeric column names to correlate
+        
+    Returns:
+        Correlation DataFrame indexed and labelled by columns
+    """
+    values = df[columns].to_numpy(dtype=np.float64)
+    if not np.isfinite(values).all():
+        return df[columns].corr()
+    
+    centered = values - values.mean(axis=0)
+    cov = centered.T @ centered
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.outer(std, std)
+    # Constant columns have no defined correlation, as in df.corr()
+    corr[std == 0, :] = np.nan
+    corr[:, std == 0] = np.nan
+    np.fill_diagonal(corr, np.where(std == 0, np.nan, 1.0))
+    return pd.DataFrame(corr, index=columns, columns=columns)
@@ -3,10 +3,22 @@ Visualization creation functions for FlowViz
 Creates different types of charts based on recommendations
 """
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+# plotly.express (~40 ms to import) is loaded by the top N chart on first use
 import plotly.graph_objects as go
 from .datetime_utils import parse_datetime_column
+from .figure_utils import downsample_xy, scatter_trace_class
+from .ml_analysis import fast_corr
+
+# Bins per distribution histogram, computed here rather than in the browser
+HISTOGRAM_BINS = 50
+
+# Rows shown in the top N chart
+TOP_N = 10
+
+# Most populous categories shown in the category analysis chart
+MAX_CATEGORIES = 20
 
 
 def create_visualization(df: pd.DataFrame, recommendation: dict):
@@ -42,32 +54,34 @@ def create_visualization(df: pd.DataFrame, recommendation: dict):
 
 def create_time_series(df: pd.DataFrame, recommendation: dict):
     """Create time series line chart."""
-    df_copy = df.copy()
-    date_format = recommendation.get('date_format')
-    
-    df_copy[recommendation['x']] = parse_datetime_column(
-        df_copy, 
-        recommendation['x'], 
-        date_format
-    )
-    df_sorted = df_copy.sort_values(recommendation['x'])
-    
-    fig = go.Figure()
-    for y_col in recommendation['y']:
-        if y_col in df_sorted.columns:
-            fig.add_trace(go.Scatter(
-                x=df_sorted[recommendation['x']],
-                y=df_sorted[y_col],
-                mode='lines+markers',
-                name=y_col
-            ))
+    x_col = recommendation['x']
+    y_cols = [y_col for y_col in recommendation['y'] if y_col in df.columns]
+    
+    # Only the plotted columns are copied, parsed and sorted
+    df_sorted = df[[x_col, *y_cols]].assign(**{
+        x_col: parse_datetime_column(df, x_col, recommendation.get('date_format'))
+    }).sort_values(x_col)
+    
+    # Long series are LTTB-reduced to their visual shape before becoming traces
+    x = df_sorted[x_col].to_numpy()
+    series = [(y_col, *downsample_xy(x, df_sorted[y_col].to_numpy())) for y_col in y_cols]
+    
+    # Traces are built first and handed to the figure in one call
+    fig = go.Figure([
+        scatter_trace_class(len(y))(
+            x=x_points,
+            y=y,
+            mode='lines+markers',
+            name=y_col
+        )
+        for y_col, x_points, y in series
+    ])
     
     fig.update_layout(
         title=recommendation['title'],
         xaxis_title=recommendation['x'],
         yaxis_title='Values',
-        hovermode='x unified',
-        template='plotly_white'
+        hovermode='x unified'
     )
     
     return fig
@@ -75,35 +89,44 @@ def create_time_series(df: pd.DataFrame, recommendation: dict):
 
 def create_heatmap(df: pd.DataFrame, recommendation: dict):
     """Create correlation heatmap."""
-    corr_matrix = df[recommendation['columns']].corr()
-    fig = px.imshow(
-        corr_matrix,
-        labels=dict(color="Correlation"),
+    corr_matrix = fast_corr(df, recommendation['columns'])
+    fig = go.Figure(go.Heatmap(
+        z=corr_matrix.values,
         x=corr_matrix.columns,
         y=corr_matrix.columns,
-        color_continuous_scale='RdBu_r',
-        aspect='auto',
-        title=recommendation['title']
+        colorscale='RdBu_r',
+        colorbar=dict(title="Correlation")
+    ))
+    
+    # Matches px.imshow: first column at the top
+    fig.update_layout(
+        title=recommendation['title'],
+        yaxis=dict(autorange='reversed')
     )
     return fig
 
 
+def _binned_bar(values: pd.Series, name: str) -> go.Bar:
+    """Histogram of values pre-binned with NumPy, so only bin counts reach the browser."""
+    counts, edges = np.histogram(values.dropna().to_numpy(), bins=HISTOGRAM_BINS)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        opacity=0.7
+    )
+
+
 def create_distribution(df: pd.DataFrame, recommendation: dict):
     """Create distribution histogram."""
-    fig = go.Figure()
-    for col in recommendation['columns']:
-        fig.add_trace(go.Histogram(
-            x=df[col],
-            name=col,
-            opacity=0.7
-        ))
+    fig = go.Figure([_binned_bar(df[col], col) for col in recommendation['columns']])
     
     fig.update_layout(
         title=recommendation['title'],
         xaxis_title='Value',
         yaxis_title='Frequency',
-        barmode='overlay',
-        template='plotly_white'
+        barmode='overlay'
     )
     
     return fig
@@ -111,38 +134,59 @@ def create_distribution(df: pd.DataFrame, recommendation: dict):
 
 def create_category_analysis(df: pd.DataFrame, recommendation: dict):
     """Create category analysis bar chart."""
-    grouped = df.groupby(recommendation['category'])[recommendation['values']].mean().reset_index()
-    
-    fig = go.Figure()
-    for val_col in recommendation['values']:
-        if val_col in grouped.columns:
-            fig.add_trace(go.Bar(
-                x=grouped[recommendation['category']],
-                y=grouped[val_col],
-                name=val_col
-            ))
+    # Hash aggregation without the sort; categories are then ordered by size
+    groups = df.groupby(recommendation['category'], observed=True, sort=False)
+    largest = groups.size().nlargest(MAX_CATEGORIES).index
+    grouped = groups[recommendation['values']].mean().loc[largest].reset_index()
+    
+    fig = go.Figure([
+        go.Bar(
+            x=grouped[recommendation['category']],
+            y=grouped[val_col],
+            name=val_col
+        )
+        for val_col in recommendation['values'] if val_col in grouped.columns
+    ])
     
     fig.update_layout(
         title=recommendation['title'],
         xaxis_title=recommendation['category'],
-        yaxis_title='Average Value',
-        template='plotly_white'
+        yaxis_title='Average Value'
     )
     
     return fig
 
 
+def _top_rows(df: pd.DataFrame, category: str, value: str, n: int) -> pd.DataFrame:
+    """The n largest rows by value, ordered like df.nlargest(n, value), skipping missing values."""
+    values = df[value].to_numpy(dtype=np.float64)
+    candidates = np.flatnonzero(~np.isnan(values))
+    candidate_values = values[candidates]
+    k = min(n, len(candidates))
+    if k == 0:
+        return df[[category, value]].iloc[:0]
+    
+    # O(n) selection of the k-th largest value; rows above it are all kept
+    # and ties at it are filled in row order, like keep='first'
+    threshold = np.partition(candidate_values, len(candidates) - k)[len(candidates) - k]
+    above = candidates[candidate_values > threshold]
+    ties = candidates[candidate_values == threshold][:k - len(above)]
+    top = df[[category, value]].iloc[np.sort(np.concatenate([above, ties]))]
+    return top.sort_values(value, ascending=False, kind='stable')
+
+
 def create_top_n(df: pd.DataFrame, recommendation: dict):
     """Create top N horizontal bar chart."""
-    top_data = df.nlargest(10, recommendation['value'])[[recommendation['category'], recommendation['value']]]
+    import plotly.express as px
+    
+    top_data = _top_rows(df, recommendation['category'], recommendation['value'], TOP_N)
     
     fig = px.bar(
         top_data,
         x=recommendation['value'],
         y=recommendation['category'],
         orientation='h',
-        title=recommendation['title'],
-        template='plotly_white'
+        title=recommendation['title']
     )
     
     return fig
@@ -0,0 +1,29 @@
+"""
+Tests for helpers._backend
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from helpers._backend import fast_sum
+
+
+class FastSumTest(unittest.TestCase):
+    def test_totals_are_float64(self):
+        df = pd.DataFrame({
+            'Sales_Amount': np.full(1000, 99963.99),
+            'Units': np.full(1000, 7, dtype=np.int32),
+            'Spare': [np.nan] * 1000,
+        })
+
+        totals = fast_sum(df, ['Sales_Amount', 'Units', 'Spare'])
+
+        self.assertEqual(totals.dtype, np.float64)
+        np.testing.assert_allclose(totals, [99963990.0, 7000.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for helpers.comparison
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import unittest
+
+import pandas as pd
+
+from helpers.comparison import calculate_comparison_metrics, calculate_comparison_summary
+
+
+class ComparisonMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.previous = pd.DataFrame({'Sales': [100.0, 100.0], 'Units': [0, 0], 'Region': ['N', 'S']})
+        self.current = pd.DataFrame({'Region': ['N', 'S'], 'Units': [3, 5], 'Sales': [150.0, 150.0]})
+
+    def test_changes_are_zero_when_previous_total_is_zero(self):
+        metrics = calculate_comparison_metrics(self.current, self.previous, ['Units', 'Sales'])
+
+        self.assertEqual(metrics['metric_changes']['Units'], 0)
+        self.assertAlmostEqual(metrics['metric_changes']['Sales'], 50.0)
+        self.assertAlmostEqual(metrics['overall_change'], (308 - 200) / 200 * 100)
+        self.assertAlmostEqual(metrics['average_difference'], (4 + 150) / 2 - (0 + 100) / 2)
+
+    def test_summary_matches_metrics_in_current_column_order(self):
+        common, summary = calculate_comparison_summary(self.current, self.previous)
+        metrics = calculate_comparison_metrics(self.current, self.previous, common)
+
+        self.assertEqual(common, ['Units', 'Sales'])
+        self.assertEqual(summary['Change (%)'].tolist(),
+                         metrics['metric_changes'].round(2).tolist())
+
+    def test_summary_handles_mixed_int_and_string_column_labels(self):
+        # e.g. a headerless CSV next to a file with named columns
+        current = pd.DataFrame({0: [1.0, 2.0], 'Sales': [5.0, 5.0], 1: ['a', 'b']})
+        previous = pd.DataFrame({'Sales': [2.0, 3.0], 0: [1.0, 1.0]})
+
+        common, summary = calculate_comparison_summary(current, previous)
+
+        self.assertEqual(common, [0, 'Sales'])
+        self.assertEqual(summary['Change (%)'].tolist(), [50.0, 100.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
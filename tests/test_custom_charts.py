@@ -0,0 +1,45 @@
+"""
+Tests for helpers.custom_charts
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from helpers.custom_charts import BOX_PRECOMPUTE_THRESHOLD, create_custom_box_plot
+
+
+class BoxPlotTest(unittest.TestCase):
+    def test_category_order_does_not_depend_on_row_count(self):
+        rng = np.random.default_rng(0)
+        n = BOX_PRECOMPUTE_THRESHOLD * 2
+        df = pd.DataFrame({
+            'Region': np.array(['West', 'North', 'East', 'South'])[np.arange(n) % 4],
+            'Sales_Amount': rng.normal(size=n),
+        })
+
+        small = create_custom_box_plot(df.head(BOX_PRECOMPUTE_THRESHOLD), 'Region', 'Sales_Amount')
+        large = create_custom_box_plot(df, 'Region', 'Sales_Amount')
+
+        self.assertEqual(list(pd.unique(small.data[0].x)), ['West', 'North', 'East', 'South'])
+        self.assertEqual(list(large.data[0].x), ['West', 'North', 'East', 'South'])
+
+    def test_precomputed_quartiles_match_pandas(self):
+        rng = np.random.default_rng(1)
+        n = BOX_PRECOMPUTE_THRESHOLD * 2
+        df = pd.DataFrame({'Region': rng.choice(['East', 'West'], n), 'Sales_Amount': rng.normal(size=n)})
+        df.loc[::7, 'Sales_Amount'] = np.nan
+
+        box = create_custom_box_plot(df, 'Region', 'Sales_Amount').data[0]
+
+        for i, region in enumerate(box.x):
+            values = df.loc[df['Region'] == region, 'Sales_Amount'].dropna()
+            self.assertAlmostEqual(box.q1[i], values.quantile(0.25))
+            self.assertAlmostEqual(box.median[i], values.median())
+            self.assertAlmostEqual(box.q3[i], values.quantile(0.75))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Tests for helpers.data_io
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+from helpers.data_io import (SAMPLE_CACHE_VERSION, optimize_dtypes, read_sample_csv, read_uploaded_file,
+                             to_excel_bytes, to_parquet_bytes)
+from helpers.custom_charts import get_column_types
+from helpers.ml_analysis import analyze_data_with_ml
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SampleData')
+
+
+class ExcelExportTest(unittest.TestCase):
+    def test_workbook_round_trip_keeps_every_cell(self):
+        df = read_sample_csv(os.path.join(SAMPLE_DIR, 'Aug.csv'))
+
+        result = pd.read_excel(io.BytesIO(to_excel_bytes(df)))
+
+        self.assertEqual(list(result.columns), list(df.columns))
+        self.assertEqual(len(result), len(df))
+        # Every non-null source value must reach the workbook
+        pd.testing.assert_series_equal(result.notna().sum(), df.notna().sum(), check_dtype=False)
+        pd.testing.assert_series_equal(result['Sales_Amount'], df['Sales_Amount'],
+                                       check_dtype=False, rtol=1e-6)
+
+
+class ParquetExportTest(unittest.TestCase):
+    def test_mixed_type_column_is_written_as_text(self):
+        df = pd.DataFrame({'Item_ID': [101, 'A-7', None, 102], 'Units': [1, 2, 3, 4]})
+
+        result = pd.read_parquet(io.BytesIO(to_parquet_bytes(df)))
+
+        self.assertEqual(result['Item_ID'].tolist(), ['101', 'A-7', None, '102'])
+        self.assertEqual(result['Units'].tolist(), [1, 2, 3, 4])
+
+    def test_categoricals_survive_the_round_trip(self):
+        df = read_sample_csv(os.path.join(SAMPLE_DIR, 'Aug.csv'))
+
+        result = pd.read_parquet(io.BytesIO(to_parquet_bytes(df)))
+
+        pd.testing.assert_frame_equal(result, df)
+
+
+class SampleCacheTest(unittest.TestCase):
+    def test_cache_is_versioned_and_round_trips(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = shutil.copy(os.path.join(SAMPLE_DIR, 'Aug.csv'), tmp_dir)
+
+            parsed = read_sample_csv(csv_path)
+            cached = read_sample_csv(csv_path)
+
+            self.assertEqual(os.listdir(tmp_dir).count(f'Aug.v{SAMPLE_CACHE_VERSION}.feather'), 1)
+            self.assertEqual(len(os.listdir(tmp_dir)), 2)
+            pd.testing.assert_frame_equal(parsed, cached)
+
+
+class UploadDtypeTest(unittest.TestCase):
+    def test_repeated_dates_are_not_categorized_and_keep_time_series(self):
+        rng = np.random.default_rng(0)
+        n = 2000
+        upload = pd.DataFrame({
+            'Date': rng.choice(pd.date_range('2025-01-01', periods=30).strftime('%Y-%m-%d'), n),
+            'Region': rng.choice(['North', 'South', 'East', 'West'], n),
+            'Sales_Amount': rng.random(n) * 100,
+        })
+
+        df = read_uploaded_file(upload.to_csv(index=False).encode(), 'upload.csv')
+
+        # Arrow reads date-only values as datetime.date objects
+        self.assertEqual(df['Date'].dtype, object)
+        self.assertEqual(df['Region'].dtype.name, 'category')
+        types = [rec['type'] for rec in analyze_data_with_ml(df)]
+        self.assertIn('time_series', types)
+        self.assertEqual(get_column_types(df)['date'], ['Date'])
+
+    def test_timestamp_column_keeps_time_series(self):
+        rng = np.random.default_rng(0)
+        n = 3000
+        upload = pd.DataFrame({
+            'Timestamp': pd.date_range('2025-01-01', periods=n, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+            'Region': rng.choice(['North', 'South', 'East', 'West'], n),
+            'Sales_Amount': rng.random(n) * 100,
+        })
+
+        df = read_uploaded_file(upload.to_csv(index=False).encode(), 'upload.csv')
+
+        self.assertEqual(df['Timestamp'].dtype.kind, 'M')
+        time_series = [rec for rec in analyze_data_with_ml(df) if rec['type'] == 'time_series']
+        self.assertEqual([rec['x'] for rec in time_series], ['Timestamp'])
+        self.assertEqual(get_column_types(df)['date'], ['Timestamp'])
+
+    def test_csv_categories_are_sorted(self):
+        upload = pd.DataFrame({
+            'Promotion_Flag': ['Yes', 'No'] * 100,
+            'Region': ['West', 'East', 'North', 'South'] * 50,
+            'Sales_Amount': range(200),
+        })
+
+        df = read_uploaded_file(upload.to_csv(index=False).encode(), 'upload.csv')
+
+        self.assertEqual(df['Promotion_Flag'].cat.categories.tolist(), ['No', 'Yes'])
+        self.assertEqual(df['Region'].cat.categories.tolist(), ['East', 'North', 'South', 'West'])
+
+    def test_sample_categories_are_sorted(self):
+        df = read_sample_csv(os.path.join(SAMPLE_DIR, 'Oct.csv'))
+
+        for col in df.select_dtypes(include=['category']).columns:
+            categories = df[col].cat.categories.tolist()
+            self.assertEqual(categories, sorted(categories), col)
+
+    def test_mixed_type_excel_column_stays_object_and_can_be_displayed(self):
+        n = 200
+        upload = pd.DataFrame({
+            'Item_ID': [101 + i % 20 if i % 2 else f'A-{i % 7}' for i in range(n)],
+            'Region': ['North', 'South'] * (n // 2),
+            'Units': range(n),
+        })
+        workbook = io.BytesIO()
+        upload.to_excel(workbook, index=False)
+
+        df = read_uploaded_file(workbook.getvalue(), 'upload.xlsx')
+
+        self.assertEqual(df['Item_ID'].dtype, object)
+        self.assertEqual(df['Region'].dtype.name, 'category')
+        # Streamlit's own display path, which stringifies mixed object columns
+        convert_pandas_df_to_arrow_bytes(df)
+
+    def test_floats_stay_float64_so_totals_are_exact(self):
+        df = optimize_dtypes(pd.DataFrame({'Sales_Amount': [473.035] * 10, 'Units': [3] * 10}))
+
+        self.assertEqual(df['Sales_Amount'].dtype, np.float64)
+        self.assertEqual(df['Units'].dtype, np.int32)
+        self.assertEqual(round(df['Sales_Amount'].sum(), 6), 4730.35)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Tests for helpers.figure_utils
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from helpers.figure_utils import downsample_xy
+
+
+class DownsampleTest(unittest.TestCase):
+    def test_sorted_dates_are_reduced(self):
+        x = pd.date_range('2025-01-01', periods=10_000, freq='min')
+        y = np.sin(np.arange(10_000) / 100)
+
+        x_out, y_out = downsample_xy(x, y, max_points=500)
+
+        self.assertEqual(len(x_out), 500)
+        self.assertEqual(len(y_out), 500)
+
+    def test_label_x_is_left_whole(self):
+        labels = pd.Series(np.tile(['North', 'South', 'East', 'West'], 2500), dtype='category')
+        y = np.arange(10_000, dtype=float)
+
+        x_out, y_out = downsample_xy(labels, y, max_points=500)
+
+        self.assertIs(x_out, labels)
+        self.assertEqual(len(y_out), 10_000)
+
+
+if __name__ == '__main__':
+    unittest.main()